@@ -2,16 +2,21 @@
 """
 
 # Standard library imports
+import io
 import logging
-from datetime import datetime, timedelta
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from itertools import islice
 from math import ceil
-from typing import Generator
+from typing import Generator, List, Tuple
 
 # Third-party imports
+import pandas as pd
 from django.conf import settings
-from django.db import connections, models
+from django.db import connections, models, transaction
 from django.db.utils import ProgrammingError, IntegrityError
+from psycopg2.extras import execute_values
 
 
 def dynamic_bulk_insert(
@@ -20,11 +25,16 @@ def dynamic_bulk_insert(
     logger: logging.Logger,
     smoothing_factor: float = settings.EXPONENTIAL_SMOOTHING_FACTOR,
     target_seconds_per_batch: int = settings.TARGET_SECONDS_PER_BATCH,
+    initial_batch_size: int = settings.INITIAL_BULK_INSERT_BATCH_SIZE,
+    max_batch_size: int = settings.MAX_BULK_INSERT_BATCH_SIZE,
+    ignore_conflicts: bool = True,
     db_alias: str = "default",
 ) -> None:
     """Bulk inserts records into a database table in batches. Uses
     exponential smoothing to dynamically choose the batch size
-    based on previous database server processing times.
+    based on previous database server processing times, up to
+    a fixed maximum so that a single `INSERT` statement never
+    grows unbounded when early batches complete quickly.
 
     References:
     - ["Exponential Smoothing | Wikipedia"\
@@ -54,6 +64,21 @@ def dynamic_bulk_insert(
             affects the size of the batch. Defaults to the value
             defined in configuration settings.
 
+        initial_batch_size (`int`): The number of records to insert
+            in the first batch, before any processing times have been
+            observed. Defaults to the value defined in configuration
+            settings.
+
+        max_batch_size (`int`): The maximum number of records to
+            insert in a single batch. Defaults to the value defined
+            in configuration settings.
+
+        ignore_conflicts (`bool`): Whether to skip records that
+            conflict with existing records rather than raise an
+            error. May be disabled when the table is known to be
+            empty, so that plain `INSERT` statements are issued.
+            Defaults to `True`.
+
         db_alias (`str`): The alias of the database to use for inserts.
             Defaults to "default".
 
@@ -62,52 +87,63 @@ def dynamic_bulk_insert(
     """
     # Initialize starting variables for batch insert
     batch_ct = 0
-    batch_size = 1
-    target_time = timedelta(seconds=target_seconds_per_batch)
-    avg_record_proc_time = timedelta(seconds=0)
+    batch_size = min(initial_batch_size, max_batch_size)
+    target_time = float(target_seconds_per_batch)
+    avg_record_proc_time = 0.0
     num_inserted = 0
+    model_name = manager.model.__name__
+    log_batches = logger.isEnabledFor(logging.DEBUG)
 
     # Begin database load
     try:
         logger.info(
-            "Starting batch inserts to load record(s) "
-            f'into "{manager.model.__name__}" table.'
+            f'Starting batch inserts to load record(s) into "{model_name}" table.'
         )
 
         while True:
 
-            # Assign batch name
-            batch_name = f"Batch {batch_ct + 1:,}, Size {batch_size:,}"
-
-            # Pull batch of records to insert from list
-            logger.info(f"{batch_name} - Pulling batch of records from list.")
+            # Assign batch name and pull batch of records to insert from list
+            if log_batches:
+                batch_name = f"Batch {batch_ct + 1:,}, Size {batch_size:,}"
+                logger.debug(f"{batch_name} - Pulling batch of records from list.")
             batch = list(islice(objs, batch_size))
             if not batch:
-                logger.info("No more records left to insert. Database load complete.")
+                logger.info(
+                    "No more records left to insert. Database load complete. "
+                    f"{num_inserted:,} record(s) processed in {batch_ct:,} batch(es)."
+                )
                 break
 
             # Bulk insert records
-            logger.info(f"{batch_name} - Bulk inserting records.")
-            start_time = datetime.now()
-            manager.using(db_alias).bulk_create(batch, ignore_conflicts=True)
-            end_time = datetime.now()
-            processing_time = end_time - start_time
+            if log_batches:
+                logger.debug(f"{batch_name} - Bulk inserting records.")
+            start_time = time.monotonic()
+            manager.using(db_alias).bulk_create(
+                batch, ignore_conflicts=ignore_conflicts
+            )
+            processing_time = time.monotonic() - start_time
             num_inserted += len(batch)
-            logger.debug(f"{batch_name} - Operation completed in {processing_time}.")
+            if log_batches:
+                logger.debug(
+                    f"{batch_name} - Operation completed in "
+                    f"{processing_time:.3f} second(s)."
+                )
 
             # Calibrate proper size of next batch based on latest processing time
-            logger.info(f"{batch_name} - Calculating best size for next batch.")
             avg_record_proc_time = (
                 (1 - smoothing_factor) * avg_record_proc_time
                 + smoothing_factor * processing_time / batch_size
             )
-            if batch_ct < 5:
+            if not avg_record_proc_time:
+                batch_size *= 2
+            elif batch_ct < 5:
                 batch_size = min(
                     ceil(target_time / avg_record_proc_time),
-                    ceil(batch_size * 2),
+                    batch_size * 2,
                 )
             else:
                 batch_size = ceil(target_time / avg_record_proc_time)
+            batch_size = min(batch_size, max_batch_size)
 
             # Iterate batch count
             batch_ct += 1
@@ -149,6 +185,245 @@ def get_db_size(db_alias: str) -> str:
         raise RuntimeError(f'Failed to retrieve size of database "{db_alias}". {e}')
 
 
+def copy_db_table(
+    manager: models.Manager, from_db: str, to_db: str, ignore_conflicts: bool = True
+) -> None:
+    """Copies all rows of the given table from the source PostgreSQL
+    database to the identical table within the target PostgreSQL
+    database using the `COPY` protocol. Rows are exported from the
+    source in a background thread and streamed through an OS pipe
+    into a temporary staging table in the destination, so that
+    neither side holds the full table in memory and no row is
+    converted into a Python object. Staged rows are then inserted
+    into the destination table, skipping those already present,
+    within a single transaction. When conflicts need not be
+    handled, rows are instead copied into the destination
+    table directly.
+
+    References:
+    - https://www.postgresql.org/docs/current/sql-copy.html
+    - https://www.psycopg.org/docs/cursor.html#cursor.copy_expert
+
+    Args:
+        manager (`models.Manager`): The Django Manager for the table (i.e.,
+            the interface through which database query operations for the
+            table are exposed).
+
+        from_db (`str`): The alias of the source database (e.g., "default").
+
+        to_db (`str`): The alias of the destination database (e.g, "target").
+
+        ignore_conflicts (`bool`): Whether to skip rows that conflict
+            with existing rows in the destination table. May be
+            disabled when the destination table is known to be empty.
+            Defaults to `True`.
+
+    Returns:
+        `None`
+    """
+    # Build quoted table and column identifiers, skipping generated columns
+    table = f'"{manager.model._meta.db_table}"'
+    columns = ", ".join(
+        f'"{f.column}"' for f in manager.model._meta.concrete_fields if not f.generated
+    )
+
+    # Open pipe through which rows are streamed between databases
+    read_fd, write_fd = os.pipe()
+
+    def export_rows() -> None:
+        """Writes all rows of the source table to the pipe
+        using a dedicated connection to the source database.
+
+        Args:
+            `None`
+
+        Returns:
+            `None`
+        """
+        try:
+            with open(write_fd, "wb") as pipe_in:
+                with connections[from_db].cursor() as cursor:
+                    cursor.copy_expert(
+                        f"COPY (SELECT {columns} FROM {table}) TO STDOUT", pipe_in
+                    )
+        finally:
+            connections[from_db].close()
+
+    # Export rows in background while importing them into destination
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        export = executor.submit(export_rows)
+        with open(read_fd, "rb") as pipe_out:
+            with transaction.atomic(using=to_db):
+                with connections[to_db].cursor() as cursor:
+                    # Copy rows directly into table if conflicts are impossible
+                    if not ignore_conflicts:
+                        cursor.copy_expert(
+                            f"COPY {table} ({columns}) FROM STDIN", pipe_out
+                        )
+                        export.result()
+                        return
+
+                    # Otherwise, copy rows into staging table
+                    cursor.execute(
+                        "CREATE TEMP TABLE replication_staging ON COMMIT DROP "
+                        f"AS SELECT {columns} FROM {table} WITH NO DATA"
+                    )
+                    cursor.copy_expert(
+                        f"COPY replication_staging ({columns}) FROM STDIN", pipe_out
+                    )
+
+                    # Confirm export succeeded before publishing staged rows
+                    export.result()
+                    cursor.execute(
+                        f"INSERT INTO {table} ({columns}) "
+                        f"SELECT {columns} FROM replication_staging "
+                        "ON CONFLICT DO NOTHING"
+                    )
+
+
+def copy_insert(
+    data: pd.DataFrame,
+    manager: models.Manager,
+    logger: logging.Logger,
+    chunk_size: int = settings.COPY_INSERT_CHUNK_SIZE,
+    db_alias: str = "default",
+) -> int:
+    """Bulk inserts the rows of a DataFrame into a database table
+    using PostgreSQL's `COPY` protocol rather than the Django ORM,
+    so that no model instance or `INSERT` statement is built per
+    record. Rows are serialized to CSV in chunks and copied into a
+    temporary staging table, from which they are then inserted into
+    the destination table, skipping those that conflict with existing
+    records, within a single transaction.
+
+    References:
+    - https://www.postgresql.org/docs/current/sql-copy.html
+    - https://www.psycopg.org/docs/cursor.html#cursor.copy_expert
+
+    Args:
+        data (`pd.DataFrame`): The rows to insert. Column names must
+            match those of the table, and values must be in a form
+            accepted by PostgreSQL's text input functions (e.g.,
+            hex-encoded EWKB for geometries).
+
+        manager (`models.Manager`): The Django Manager for the table (i.e.,
+            the interface through which database query operations for the
+            table are exposed).
+
+        logger (`logging.Logger`): A standard logger instance.
+
+        chunk_size (`int`): The number of rows to serialize and copy
+            at once. Defaults to the value defined in configuration
+            settings.
+
+        db_alias (`str`): The alias of the database to use for inserts.
+            Defaults to "default".
+
+    Returns:
+        (`int`): The number of rows processed.
+    """
+    # Build quoted table and column identifiers
+    table = f'"{manager.model._meta.db_table}"'
+    columns = ", ".join(f'"{col}"' for col in data.columns)
+
+    # Treat empty values in non-nullable columns as empty strings rather than nulls
+    not_null = ", ".join(
+        f'"{f.column}"'
+        for f in manager.model._meta.concrete_fields
+        if f.column in data.columns and not f.null
+    )
+    options = f"FORMAT csv, FORCE_NOT_NULL ({not_null})" if not_null else "FORMAT csv"
+
+    # Copy rows into staging table in chunks and then insert them into table
+    logger.info(
+        f'Copying {len(data):,} record(s) into "{manager.model.__name__}" table '
+        f"in chunks of {chunk_size:,}."
+    )
+    connection = connections[db_alias]
+    with connection.wrap_database_errors, transaction.atomic(using=db_alias):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TEMP TABLE insert_staging ON COMMIT DROP "
+                f"AS SELECT {columns} FROM {table} WITH NO DATA"
+            )
+            for start in range(0, len(data), chunk_size):
+                buffer = io.StringIO()
+                data.iloc[start : start + chunk_size].to_csv(
+                    buffer, header=False, index=False
+                )
+                buffer.seek(0)
+                cursor.copy_expert(
+                    f"COPY insert_staging ({columns}) FROM STDIN WITH ({options})",
+                    buffer,
+                )
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) "
+                f"SELECT {columns} FROM insert_staging "
+                "ON CONFLICT DO NOTHING"
+            )
+
+    return len(data)
+
+
+def values_insert(
+    rows: List[Tuple],
+    manager: models.Manager,
+    columns: List[str],
+    logger: logging.Logger,
+    page_size: int = settings.VALUES_INSERT_PAGE_SIZE,
+    db_alias: str = "default",
+) -> int:
+    """Bulk inserts tuples of values into a database table using
+    psycopg2's `execute_values`, which interpolates each page of rows
+    into a single multi-row `INSERT` statement without constructing
+    model instances or invoking Django's SQL compiler. Rows that
+    conflict with existing records are skipped. All pages are
+    inserted within a single transaction.
+
+    References:
+    - https://www.psycopg.org/docs/extras.html#psycopg2.extras.execute_values
+
+    Args:
+        rows (`list` of `tuple`): The rows to insert. Each row's
+            values must be ordered as in `columns`.
+
+        manager (`models.Manager`): The Django Manager for the table (i.e.,
+            the interface through which database query operations for the
+            table are exposed).
+
+        columns (`list` of `str`): The names of the table columns
+            to populate.
+
+        logger (`logging.Logger`): A standard logger instance.
+
+        page_size (`int`): The maximum number of rows to include
+            in a single statement. Defaults to the value defined
+            in configuration settings.
+
+        db_alias (`str`): The alias of the database to use for inserts.
+            Defaults to "default".
+
+    Returns:
+        (`int`): The number of rows processed.
+    """
+    # Build insert statement from quoted table and column identifiers
+    table = f'"{manager.model._meta.db_table}"'
+    quoted_columns = ", ".join(f'"{col}"' for col in columns)
+    sql = f"INSERT INTO {table} ({quoted_columns}) VALUES %s ON CONFLICT DO NOTHING"
+
+    # Insert rows in pages
+    logger.info(
+        f'Inserting {len(rows):,} record(s) into "{manager.model.__name__}" '
+        f"table in pages of {page_size:,}."
+    )
+    connection = connections[db_alias]
+    with connection.wrap_database_errors, transaction.atomic(using=db_alias):
+        with connection.cursor() as cursor:
+            execute_values(cursor.cursor, sql, rows, page_size=page_size)
+
+    return len(rows)
+
+
 def replicate_db_table(
     manager: models.Manager,
     from_db: str,
@@ -157,7 +432,10 @@ def replicate_db_table(
     batch_size: int = settings.DB_REPLICATION_CHUNK_SIZE,
 ) -> int:
     """Copies data from the given source database table
-    to an identical table within the target database.
+    to an identical table within the target database. When
+    both databases are PostgreSQL, rows are streamed between
+    them with the `COPY` protocol. Otherwise, they are read
+    through the Django ORM and bulk inserted in batches.
 
     Args:
         manager (`models.Manager`): The Django Manager for the table (i.e.,
@@ -170,9 +448,10 @@ def replicate_db_table(
 
         logger (`logging.Logger`): A standard logger instance.
 
-        batch_size (`int`): The maximum number of rows to insert from the
-            origin/source table to the destination table at once.
-            Defaults to the value defined in configuration settings.
+        batch_size (`int`): The number of rows to fetch from the
+            origin/source table's server-side cursor at once when
+            the `COPY` protocol is unavailable. Defaults to the
+            value defined in configuration settings.
 
     Returns:
         (`int`): The number of rows added to the destination table.
@@ -181,7 +460,7 @@ def replicate_db_table(
     table_name = manager.model.__name__
 
     # Count number of objects in tables before replication
-    source_table_count = manager.count()
+    source_table_count = manager.using(from_db).count()
     dest_table_count = manager.using(to_db).count()
     logger.info(
         f"{dest_table_count:,} record(s) found in table "
@@ -190,23 +469,30 @@ def replicate_db_table(
         f"database has {source_table_count:,} record(s)."
     )
 
-    # Fetch primary keys from table
-    logger.info(
-        f"Fetching primary keys from table "
-        f'"{table_name}" in source database "{from_db}".'
-    )
-    pks = manager.using(from_db).values_list("id", flat=True).all()
-    logger.info(f"{len(pks):,} key(s) found.")
+    # Copy records directly between databases if both are PostgreSQL
+    if all(connections[db].vendor == "postgresql" for db in (from_db, to_db)):
+        logger.info(
+            f'Copying records from table "{table_name}" in source database '
+            f'"{from_db}" to destination table using the COPY protocol.'
+        )
+        copy_db_table(manager, from_db, to_db, ignore_conflicts=bool(dest_table_count))
 
-    # Batch primary keys and retrieve corresponding full objects
-    logger.info(
-        f"Batching keys into groups of {batch_size:,} and then bulk "
-        "inserting records associated with keys into destination table."
-    )
-    for i in range(0, len(pks), batch_size):
-        pk_batch = pks[i : i + batch_size]
-        objs = (obj for obj in manager.using(from_db).filter(pk__in=pk_batch).all())
-        dynamic_bulk_insert(objs, manager, logger, db_alias=to_db)
+    # Otherwise, stream records from source table in primary key order,
+    # fetching them from a server-side cursor in chunks, and bulk insert them
+    else:
+        logger.info(
+            f'Streaming records from table "{table_name}" in source database '
+            f'"{from_db}" in chunks of {batch_size:,} and then bulk inserting '
+            "them into destination table."
+        )
+        objs = manager.using(from_db).order_by("pk").iterator(chunk_size=batch_size)
+        dynamic_bulk_insert(
+            objs,
+            manager,
+            logger,
+            ignore_conflicts=bool(dest_table_count),
+            db_alias=to_db,
+        )
 
     # Count final number of objects in destination table
     objs_added = manager.using(to_db).count() - dest_table_count
@@ -215,6 +501,8 @@ def replicate_db_table(
         f'added to destination table "{table_name}".'
     )
 
+    return objs_added
+
 
 def vacuum_db(db_name: str) -> None:
     """Performs a full vacuum on the given database.
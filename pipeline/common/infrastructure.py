@@ -1,30 +1,103 @@
 """Classes and functions enabling the deployment of cloud infrastructure.
 """
 
-import requests
+# Standard library imports
 import subprocess
+from typing import Dict
+
+# Third-party imports
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class GcloudSqlClient:
-    """ """
+    """Wrapper for API requests against the Cloud SQL Admin API."""
+
+    BASE_URL = "https://sqladmin.googleapis.com/v1"
+    """The base URL of the Cloud SQL Admin API.
+    """
 
     def __init__(self) -> None:
-        """"""
+        """Initializes a new instance of a `GcloudSqlClient`. Opens
+        a session whose pooled connections are reused across requests
+        and whose requests are retried with exponential backoff
+        when the API is temporarily unavailable.
+
+        Args:
+            `None`
+
+        Returns:
+            `None`
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=None,
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(max_retries=retry))
+
+    def _get_access_token(self) -> str:
+        """Fetches an OAuth 2.0 access token for the account
+        currently authenticated with the Google Cloud CLI.
+
+        Raises:
+            (`RuntimeError`) if the token could not be fetched.
+
+        Returns:
+            (`str`): The access token.
+        """
+        try:
+            result = subprocess.run(
+                ["gcloud", "auth", "print-access-token"],
+                capture_output=True,
+                check=True,
+                text=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise RuntimeError(f"Failed to fetch Google Cloud access token. {e}")
+        return result.stdout.strip()
 
     def create_server(
         self,
-        project_id,
+        project_id: str,
         instance_id: str,
         region: str,
         db_version: str,
         password: str,
         tier: str,
         edition: str,
-    ):
-        """
+    ) -> Dict:
+        """Creates a new Cloud SQL database instance.
+
         References:
         - https://cloud.google.com/sql/docs/postgres/instance-settings#settings-2ndgen
+        - https://cloud.google.com/sql/docs/postgres/admin-api/rest/v1/instances/insert
+
+        Args:
+            project_id (`str`): The id of the Google Cloud project.
+
+            instance_id (`str`): The name of the new instance.
+
+            region (`str`): The region in which to create the instance.
+
+            db_version (`str`): The database engine type and version.
+
+            password (`str`): The password for the root user.
+
+            tier (`str`): The machine type of the instance.
+
+            edition (`str`): The Cloud SQL edition of the instance.
+
+        Raises:
+            (`RuntimeError`) if the request fails.
+
+        Returns:
+            (`dict`): The long-running operation creating the instance.
         """
+        # Build request body
         payload = {
             "name": instance_id,
             "region": region,
@@ -49,6 +122,19 @@ class GcloudSqlClient:
             },
         }
 
+        # Make request
+        url = f"{GcloudSqlClient.BASE_URL}/projects/{project_id}/instances"
+        headers = {"Authorization": f"Bearer {self._get_access_token()}"}
+        r = self._session.post(url, json=payload, headers=headers, timeout=(5, 30))
+        if not r.ok:
+            raise RuntimeError(
+                f'The request to create Cloud SQL instance "{instance_id}" '
+                f'failed with a "{r.status_code} - {r.reason}" status '
+                f'code and the text "{r.text}".'
+            )
+
+        return r.json()
+
 
 if __name__ == "__main__":
     client = GcloudSqlClient()
@@ -7,20 +7,29 @@ import glob
 import io
 import json
 import os
+import shutil
 import tempfile
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from zipfile import BadZipFile, ZipFile
 
 # Third-party imports
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import shapely
 from django.conf import settings
 from google.api_core.exceptions import NotFound
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
+from pyarrow import csv as pa_csv
 from pyarrow import parquet as pq
+from requests.adapters import HTTPAdapter
 
 
 class IFileStrategy(ABC):
@@ -54,13 +63,15 @@ class UnzippedFileStrategy(IFileStrategy):
         Yields:
             (`io.IOBase`): A file object.
         """
-        # Detect UTF-8 BOM encoding if applicable
-        try:
-            with open(fpath, "rb") as f:
-                first_bytes = f.read(3)
-            encoding = "utf-8-sig" if first_bytes == b"\xef\xbb\xbf" else None
-        except FileNotFoundError:
-            encoding = None
+        # Detect UTF-8 BOM encoding if applicable to text mode
+        encoding = None
+        if "b" not in mode:
+            try:
+                with open(fpath, "rb") as f:
+                    first_bytes = f.read(3)
+                encoding = "utf-8-sig" if first_bytes == b"\xef\xbb\xbf" else None
+            except FileNotFoundError:
+                pass
 
         # Open file
         f = open(fpath, mode, encoding=encoding)
@@ -103,9 +114,11 @@ class ZippedFileStrategy(IFileStrategy):
         except (FileNotFoundError, BadZipFile):
             encoding = None
 
-        # Open file
-        zip_file = ZipFile(fpath, mode)
-        f = zip_file.open(zip_file_path, mode, encoding)
+        # Open file. Zipped members are always read and written as bytes,
+        # so a binary mode (e.g., "rb") is accepted and treated as its base.
+        zip_mode = mode.replace("b", "")
+        zip_file = ZipFile(fpath, zip_mode)
+        f = zip_file.open(zip_file_path, zip_mode, encoding)
 
         # Yield file
         try:
@@ -151,6 +164,61 @@ class FileSystemHelper(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_stats(
+        self,
+        file_name: str,
+        root_dir: Union[Path, str] = settings.DATA_DIR,
+    ) -> Tuple[float, int]:
+        """Fetches the time at which a file was last modified
+        and its size.
+
+        Args:
+            file_name (`str`): The file name, representing the
+                relative path to the file within the root directory.
+
+            root_dir (`pathlib.Path` | `str`): The designated
+                parent/top-most directory of the file system.
+                Defaults to the data directory defined in the
+                Django settings module that corresponds to
+                the current development environment.
+
+        Raises:
+            (`FileNotFoundError`) if the file does not exist.
+
+        Returns:
+            ((`float`, `int`)): The modification time, expressed
+                in seconds since the epoch, and the size in bytes.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_last_modified(
+        self,
+        file_name: str,
+        root_dir: Union[Path, str] = settings.DATA_DIR,
+    ) -> float:
+        """Fetches the time at which a file was last modified.
+
+        Args:
+            file_name (`str`): The file name, representing the
+                relative path to the file within the root directory.
+
+            root_dir (`pathlib.Path` | `str`): The designated
+                parent/top-most directory of the file system.
+                Defaults to the data directory defined in the
+                Django settings module that corresponds to
+                the current development environment.
+
+        Raises:
+            (`FileNotFoundError`) if the file does not exist.
+
+        Returns:
+            (`float`): The modification time, expressed
+                in seconds since the epoch.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     @contextmanager
     def open_file(
@@ -226,6 +294,62 @@ class LocalFileSystemHelper(FileSystemHelper):
                 out.append(pth)
         return out
 
+    def get_stats(
+        self,
+        file_name: str,
+        root_dir: Union[Path, str] = settings.DATA_DIR,
+    ) -> Tuple[float, int]:
+        """Fetches the time at which a file was last modified
+        and its size.
+
+        Args:
+            file_name (`str`): The file name, representing the
+                the relative path to the file within the root
+                directory.
+
+            root_dir (`pathlib.Path` | `str`): The absolute path to
+                the parent/top-most directory of the file
+                system. Defaults to the data directory
+                defined in the Django settings module that
+                corresponds to the current development environment.
+
+        Raises:
+            (`FileNotFoundError`) if the file does not exist.
+
+        Returns:
+            ((`float`, `int`)): The modification time, expressed
+                in seconds since the epoch, and the size in bytes.
+        """
+        stats = os.stat(Path(root_dir) / file_name)
+        return stats.st_mtime, stats.st_size
+
+    def get_last_modified(
+        self,
+        file_name: str,
+        root_dir: Union[Path, str] = settings.DATA_DIR,
+    ) -> float:
+        """Fetches the time at which a file was last modified.
+
+        Args:
+            file_name (`str`): The file name, representing the
+                the relative path to the file within the root
+                directory.
+
+            root_dir (`pathlib.Path` | `str`): The absolute path to
+                the parent/top-most directory of the file
+                system. Defaults to the data directory
+                defined in the Django settings module that
+                corresponds to the current development environment.
+
+        Raises:
+            (`FileNotFoundError`) if the file does not exist.
+
+        Returns:
+            (`float`): The modification time, expressed
+                in seconds since the epoch.
+        """
+        return os.path.getmtime(Path(root_dir) / file_name)
+
     @contextmanager
     def open_file(
         self,
@@ -262,8 +386,8 @@ class LocalFileSystemHelper(FileSystemHelper):
         fpath = Path(root_dir) / file_name
 
         # Create file's parent directories if writing
-        if not fpath.exists():
-            Path(fpath).parent.mkdir(parents=True, exist_ok=True)
+        if not mode.startswith("r"):
+            fpath.parent.mkdir(parents=True, exist_ok=True)
 
         # Determine strategy necessary to yield file contents
         file_strategy: IFileStrategy = (
@@ -288,8 +412,18 @@ class GoogleCloudStorageHelper(FileSystemHelper):
         Returns:
             `None`
         """
+        # Create client
         self.storage_client = storage.Client()
 
+        # Enlarge the client's connection pool so that concurrent reads
+        # and metadata requests reuse kept-alive connections instead of
+        # discarding them once the default pool of ten is full
+        adapter = HTTPAdapter(
+            pool_connections=settings.GCS_HTTP_POOL_SIZE,
+            pool_maxsize=settings.GCS_HTTP_POOL_SIZE,
+        )
+        self.storage_client._http.mount("https://", adapter)
+
     def list_contents(
         self,
         root_dir: Union[Path, str] = settings.DATA_DIR,
@@ -333,6 +467,67 @@ class GoogleCloudStorageHelper(FileSystemHelper):
         except Exception as e:
             raise RuntimeError(f"Failed to list blobs in storage bucket. {e}") from None
 
+    def get_stats(
+        self,
+        file_name: str,
+        root_dir: Union[Path, str] = settings.DATA_DIR,
+    ) -> Tuple[float, int]:
+        """Fetches the time at which a blob was last modified
+        and its size.
+
+        References:
+        - [Cloud Storage Documentation | "Class Blob (2.14.0)"](https://cloud.google.com/python/docs/reference/storage/latest/google.cloud.storage.blob.Blob)
+
+        Args:
+            file_name (`str`): The file/blob name, representing the
+                the relative path to the blob within the bucket.
+
+            root_dir (`pathlib.Path` | `str`): The cloud
+                storage bucket name. Defaults to the bucket
+                defined in the Django settings module.
+
+        Raises:
+            (`FileNotFoundError`) if the blob does not exist.
+
+        Returns:
+            ((`float`, `int`)): The modification time, expressed
+                in seconds since the epoch, and the size in bytes.
+        """
+        blob = self.storage_client.bucket(root_dir).get_blob(file_name)
+        if blob is None:
+            raise FileNotFoundError
+        return blob.updated.timestamp(), blob.size
+
+    def get_last_modified(
+        self,
+        file_name: str,
+        root_dir: Union[Path, str] = settings.DATA_DIR,
+    ) -> float:
+        """Fetches the time at which a blob was last modified.
+
+        References:
+        - [Cloud Storage Documentation | "Class Blob (2.14.0)"](https://cloud.google.com/python/docs/reference/storage/latest/google.cloud.storage.blob.Blob)
+
+        Args:
+            file_name (`str`): The file/blob name, representing the
+                the relative path to the blob within the bucket.
+
+            root_dir (`pathlib.Path` | `str`): The cloud
+                storage bucket name. Defaults to the bucket
+                defined in the Django settings module.
+
+        Raises:
+            (`FileNotFoundError`) if the blob does not exist.
+
+        Returns:
+            (`float`): The modification time, expressed
+                in seconds since the epoch.
+        """
+        blob = self.storage_client.bucket(root_dir).get_blob(file_name)
+        if blob is None:
+            raise FileNotFoundError
+        return blob.updated.timestamp()
+
     @contextmanager
     def open_file(
         self,
@@ -341,10 +536,19 @@ class GoogleCloudStorageHelper(FileSystemHelper):
         mode: str = "r",
         zip_file_path: Optional[str] = None,
     ) -> Iterator[io.IOBase]:
-        """Opens a file with the given name and mode.
+        """Opens a file with the given name and mode. Unzipped
+        files opened for reading are streamed from the blob in
+        chunks, so that callers may begin parsing before the
+        download completes and the full contents are never held
+        in memory or on disk at once. All other files are first
+        transferred to a temporary file on disk. Blobs larger than
+        the configured threshold are always transferred to disk, as
+        their byte ranges can then be downloaded over several
+        connections concurrently rather than through a single stream.
 
         References:
         - [Cloud Storage Documentation | "Module fileio (2.14.0)"](https://cloud.google.com/python/docs/reference/storage/latest/google.cloud.storage.fileio)
+        - [Cloud Storage Documentation | "Module transfer_manager"](https://cloud.google.com/python/docs/reference/storage/latest/google.cloud.storage.transfer_manager)
 
         Args:
             file_name (`str`): The file/blob name, representing the
@@ -369,7 +573,28 @@ class GoogleCloudStorageHelper(FileSystemHelper):
         bucket = self.storage_client.bucket(root_dir)
         blob = bucket.blob(file_name)
 
-        # Determine strategy necessary to yield file contents
+        # Fetch blob size if reading
+        is_reading = mode.startswith("r")
+        if is_reading:
+            try:
+                blob.reload()
+            except NotFound:
+                raise FileNotFoundError
+            is_large = blob.size > settings.GCS_PARALLEL_DOWNLOAD_THRESHOLD
+
+        # Stream unzipped file contents directly from blob if reading small file
+        if is_reading and zip_file_path is None and not is_large:
+            encoding = None if "b" in mode else "utf-8-sig"
+            try:
+                with blob.open(
+                    mode, chunk_size=settings.GCS_READ_CHUNK_SIZE, encoding=encoding
+                ) as f:
+                    yield f
+            except NotFound:
+                raise FileNotFoundError
+            return
+
+        # Otherwise, determine strategy necessary to yield file contents
         file_strategy: IFileStrategy = (
             ZippedFileStrategy()
             if zip_file_path is not None
@@ -379,10 +604,20 @@ class GoogleCloudStorageHelper(FileSystemHelper):
         # Open temporary file on disk
         tf = tempfile.NamedTemporaryFile(delete=False)
 
-        # Download contents to disk if reading
-        if mode.startswith("r"):
+        # Download contents to disk if reading, fetching
+        # chunks of large files concurrently in threads
+        if is_reading:
             try:
-                blob.download_to_filename(tf.name)
+                if is_large:
+                    transfer_manager.download_chunks_concurrently(
+                        blob,
+                        tf.name,
+                        chunk_size=settings.GCS_PARALLEL_DOWNLOAD_CHUNK_SIZE,
+                        worker_type=transfer_manager.THREAD,
+                        max_workers=settings.GCS_PARALLEL_DOWNLOAD_MAX_WORKERS,
+                    )
+                else:
+                    blob.download_to_filename(tf.name)
             except NotFound:
                 raise FileNotFoundError
 
@@ -390,7 +625,7 @@ class GoogleCloudStorageHelper(FileSystemHelper):
         try:
             yield from file_strategy.execute(tf.name, mode, zip_file_path=zip_file_path)
         finally:
-            if not mode.startswith("r"):
+            if not is_reading:
                 blob.upload_from_file(tf)
             tf.close()
             os.remove(tf.name)
@@ -402,12 +637,16 @@ class FileSystemHelperFactory:
     """
 
     _helper: Optional[FileSystemHelper] = None
+    _lock: threading.Lock = threading.Lock()
 
     @staticmethod
     def get() -> FileSystemHelper:
         """Fetches a local or cloud-based file system
         helper based on the current name of the
         development environment (e.g., "DEV" or "PROD").
+        The helper, and therefore any cloud storage client
+        it holds, is created at most once per process, even
+        when first requested by several threads at once.
 
         Args:
             `None`
@@ -415,19 +654,42 @@ class FileSystemHelperFactory:
         Returns:
             (`FileSystemHelper`)
         """
-        if not FileSystemHelperFactory._helper:
-            env = os.environ.get("ENV", "DEV")
-            if env in ("DEV", "TEST"):
-                FileSystemHelperFactory._helper = LocalFileSystemHelper()
-            elif env == "PROD":
-                FileSystemHelperFactory._helper = GoogleCloudStorageHelper()
-            else:
-                raise RuntimeError(
-                    "Unable to instantiate FileSystemHelper. Invalid "
-                    f"environment variable passed for 'ENV': {env}."
-                )
+        # Return existing helper without acquiring lock if available
+        if FileSystemHelperFactory._helper:
+            return FileSystemHelperFactory._helper
+
+        # Otherwise, create helper unless another thread has already done so
+        with FileSystemHelperFactory._lock:
+            if not FileSystemHelperFactory._helper:
+                env = os.environ.get("ENV", "DEV")
+                if env in ("DEV", "TEST"):
+                    FileSystemHelperFactory._helper = LocalFileSystemHelper()
+                elif env == "PROD":
+                    FileSystemHelperFactory._helper = GoogleCloudStorageHelper()
+                else:
+                    raise RuntimeError(
+                        "Unable to instantiate FileSystemHelper. Invalid "
+                        f"environment variable passed for 'ENV': {env}."
+                    )
         return FileSystemHelperFactory._helper
 
+    @staticmethod
+    def reset() -> None:
+        """Discards the cached helper, along with any cloud storage
+        client and pooled connections it holds, so that the next
+        call to `get` creates a new one. Intended to be called at
+        the start of forked worker processes, which must not share
+        the parent's sockets or inherit locks held by its threads.
+
+        Args:
+            `None`
+
+        Returns:
+            `None`
+        """
+        FileSystemHelperFactory._lock = threading.Lock()
+        FileSystemHelperFactory._helper = None
+
 
 class IterativeDataReader(ABC):
     """Abstract class for iteratively reading against a data type."""
@@ -583,7 +845,9 @@ class ParquetDataReader(IterativeDataReader):
             finally:
                 pf.close()
 
-    def iterate(self, file_name: str, **kwargs) -> Iterator[Dict[str, Any]]:
+    def iterate(
+        self, file_name: str, columns: Optional[List[str]] = None, **kwargs
+    ) -> Iterator[Dict[str, Any]]:
         """Reads the Parquet file and then returns a
         generator yielding one row at a time.
 
@@ -591,19 +855,125 @@ class ParquetDataReader(IterativeDataReader):
             file_name (`str`): The relative path to the file
                 within the root directory.
 
+            columns (`list` of `str`): The subset of columns to
+                read. Only these column chunks are decompressed
+                and decoded. Defaults to `None`, in which case
+                all columns are read.
+
             **kwargs: Additional keywords passed to the underlying
                 pyarrow `ParquetFile` constructor.
 
         Yields:
             (`list` of `dict`): The GeoJSON features.
         """
-        with self._file_helper.open_file(file_name, self._root_dir, mode="rb") as f:
-            pf = pq.ParquetFile(f)
-            pf_iter = pf.iter_batches(settings.PQ_CHUNK_SIZE)
-            for batch in pf_iter:
-                row_list = batch.to_pylist()
-                for row in row_list:
-                    yield row
+        for batch in self.iterate_batches(file_name, columns):
+            # Convert each column to Python objects once, then
+            # assemble the row dictionaries lazily as they're yielded
+            col_names = batch.schema.names
+            col_values = [column.to_pylist() for column in batch.columns]
+            for row in zip(*col_values):
+                yield dict(zip(col_names, row))
+
+    def iterate_batches(
+        self,
+        file_name: str,
+        columns: Optional[List[str]] = None,
+        batch_size: Optional[int] = settings.PQ_CHUNK_SIZE,
+    ) -> Iterator[pa.RecordBatch]:
+        """Reads the Parquet file and then returns a generator
+        yielding one Arrow record batch at a time, so that
+        consumers can operate on entire columns at once.
+
+        Args:
+            file_name (`str`): The relative path to the file
+                within the root directory.
+
+            columns (`list` of `str`): The subset of columns to
+                read. Defaults to `None`, in which case all
+                columns are read.
+
+            batch_size (`int`): The maximum number of rows per
+                batch. Defaults to `settings.PQ_CHUNK_SIZE`. If
+                `None`, one batch is yielded per row group, so
+                that batch boundaries align with the file's units
+                of compression and no batch is sliced from another.
+
+        Yields:
+            (`pa.RecordBatch`): The batches. The next batch is
+                read and decoded in a background thread while
+                the current one is being consumed.
+        """
+        with self._file_helper.open_file(
+            file_name, self._root_dir, mode="rb"
+        ) as f, ThreadPoolExecutor(max_workers=1) as executor:
+            # Coalesce the reads for each row group's column chunks into a
+            # few large requests rather than many small ones per chunk
+            pf = pq.ParquetFile(f, pre_buffer=True)
+            if batch_size:
+                batches = pf.iter_batches(batch_size, columns=columns, use_threads=True)
+            else:
+                batches = (
+                    batch
+                    for i in range(pf.num_row_groups)
+                    for batch in pf.read_row_group(
+                        i, columns=columns, use_threads=True
+                    ).to_batches()
+                )
+
+            # Prefetch one batch ahead of the consumer. PyArrow releases
+            # the GIL while decoding, so the two overlap.
+            pending = executor.submit(next, batches, None)
+            while (batch := pending.result()) is not None:
+                pending = executor.submit(next, batches, None)
+                yield batch
+
+    def iterate_frames(
+        self,
+        file_name: str,
+        columns: Optional[List[str]] = None,
+        batch_size: Optional[int] = settings.PQ_CHUNK_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        """Reads the Parquet file and then returns a generator
+        yielding one DataFrame per record batch. If the file
+        is a GeoParquet file and its primary geometry column
+        was read, a GeoDataFrame is yielded instead, with the
+        geometries decoded from WKB and the file's CRS applied.
+
+        Args:
+            file_name (`str`): The relative path to the file
+                within the root directory.
+
+            columns (`list` of `str`): The subset of columns to
+                read. Defaults to `None`, in which case all
+                columns are read.
+
+            batch_size (`int`): The maximum number of rows per
+                DataFrame. Defaults to `settings.PQ_CHUNK_SIZE`. If
+                `None`, one DataFrame is yielded per row group.
+
+        Yields:
+            (`pd.DataFrame` | `gpd.GeoDataFrame`): The batches.
+        """
+        for batch in self.iterate_batches(file_name, columns, batch_size):
+            # Convert batch to DataFrame
+            df = batch.to_pandas()
+
+            # Return as-is if the batch holds no primary geometry column
+            geo_metadata = (batch.schema.metadata or {}).get(b"geo")
+            if not geo_metadata:
+                yield df
+                continue
+            geo_metadata = json.loads(geo_metadata)
+            geom_col = geo_metadata["primary_column"]
+            if geom_col not in df.columns:
+                yield df
+                continue
+
+            # Otherwise, decode geometries and apply the CRS, which
+            # the GeoParquet specification defaults to OGC:CRS84
+            crs = geo_metadata["columns"][geom_col].get("crs", "OGC:CRS84")
+            df[geom_col] = gpd.GeoSeries.from_wkb(df[geom_col], crs=crs)
+            yield gpd.GeoDataFrame(df, geometry=geom_col)
 
 
 class IterativeDataReaderFactory:
@@ -687,13 +1057,88 @@ class DataLoader:
         """
         return self._file_helper.list_contents(self._root_dir, glob_pattern)
 
+    def get_stats(
+        self,
+        glob_pattern: str,
+        max_workers: int = settings.FILE_METADATA_MAX_WORKERS,
+    ) -> List[Tuple[str, float, int]]:
+        """Fetches the modification time and size of every
+        file within the root directory matching the given
+        glob pattern. Each lookup may require a network round
+        trip (e.g., for Google Cloud Storage), so files are
+        checked concurrently by a pool of threads.
+
+        Args:
+            glob_pattern (`str`): A relative path to search
+                for within the directory. May contain
+                shell-like wildcards.
+
+            max_workers (`int`): The maximum number of files to
+                check at once. Defaults to the value configured
+                in the Django settings module.
+
+        Returns:
+            (`list` of (`str`, `float`, `int`)): The file names,
+                modification times in seconds since the epoch,
+                and sizes in bytes, sorted by file name. Empty
+                if no matching files were found.
+        """
+        fpaths = sorted(self.list_directory_contents(glob_pattern))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            stats = list(
+                executor.map(
+                    lambda pth: self._file_helper.get_stats(pth, self._root_dir),
+                    fpaths,
+                )
+            )
+        return [(pth, mtime, size) for pth, (mtime, size) in zip(fpaths, stats)]
+
+    def get_last_modified(
+        self,
+        glob_pattern: str,
+        max_workers: int = settings.FILE_METADATA_MAX_WORKERS,
+    ) -> Optional[float]:
+        """Fetches the most recent modification time among
+        all files within the root directory matching the
+        given glob pattern. Each lookup may require a network
+        round trip (e.g., for Google Cloud Storage), so files
+        are checked concurrently by a pool of threads.
+
+        Args:
+            glob_pattern (`str`): A relative path to search
+                for within the directory. May contain
+                shell-like wildcards.
+
+            max_workers (`int`): The maximum number of files to
+                check at once. Defaults to the value configured
+                in the Django settings module.
+
+        Returns:
+            (`float` | `None`): The modification time, expressed
+                in seconds since the epoch, or `None` if no
+                matching files were found.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            timestamps = list(
+                executor.map(
+                    lambda pth: self._file_helper.get_last_modified(
+                        pth, self._root_dir
+                    ),
+                    self.list_directory_contents(glob_pattern),
+                )
+            )
+        return max(timestamps, default=None)
+
     def read_csv(
         self,
         file_name: str,
         zip_file_path: Optional[str] = None,
         **kwargs,
     ) -> pd.DataFrame:
-        """Reads a CSV file into a Pandas DataFrame.
+        """Reads a CSV file into a Pandas DataFrame. Unless
+        overridden, the file is parsed by the C engine in a single
+        pass (i.e., with "low_memory" disabled) rather than in
+        chunks whose column types must later be reconciled.
 
         References:
         - https://pandas.pydata.org/docs/reference/api/pandas.read_csv.html
@@ -712,12 +1157,77 @@ class DataLoader:
         Returns:
             (`pd.DataFrame`): The `DataFrame`.
         """
+        # Parse file in a single pass unless configured otherwise
+        kwargs.setdefault("engine", "c")
+        kwargs.setdefault("low_memory", False)
+
+        # Read file
         mode = "r"
         with self._file_helper.open_file(
             file_name, self._root_dir, mode, zip_file_path
         ) as f:
             return pd.read_csv(f, **kwargs)
 
+    def read_csv_columns(
+        self,
+        file_name: str,
+        columns: Dict[str, pa.DataType],
+        zip_file_path: Optional[str] = None,
+        delimiter: str = ",",
+    ) -> pd.DataFrame:
+        """Reads select columns of a CSV file into a Pandas DataFrame
+        using PyArrow's multithreaded CSV reader, which tokenizes the
+        file in parallel blocks and builds contiguous column buffers
+        directly rather than one Python object per cell. Best suited
+        to large files whose needed columns and types are known ahead
+        of time. As with `pandas.read_csv`, empty values are read as
+        nulls.
+
+        References:
+        - https://arrow.apache.org/docs/python/generated/pyarrow.csv.read_csv.html
+
+        Args:
+            file_name (`str`): The relative path to the file
+                within the root directory.
+
+            columns (`dict` of `str`, `pa.DataType`): The names of
+                the columns to read, mapped to their data types.
+
+            zip_file_path (`str`): The path to the CSV file
+                within a zip folder, if applicable. Defaults
+                to `None`.
+
+            delimiter (`str`): The character delimiting fields.
+                Defaults to a comma.
+
+        Returns:
+            (`pd.DataFrame`): The `DataFrame`.
+        """
+        # Configure parser to read only given columns with given types,
+        # splitting the file into large blocks that are parsed in parallel
+        read_options = pa_csv.ReadOptions(block_size=settings.CSV_READ_BLOCK_SIZE)
+        parse_options = pa_csv.ParseOptions(delimiter=delimiter)
+        convert_options = pa_csv.ConvertOptions(
+            include_columns=list(columns),
+            column_types=columns,
+            strings_can_be_null=True,
+        )
+
+        # Read file as Arrow table. PyArrow requires a binary file object.
+        mode = "rb"
+        with self._file_helper.open_file(
+            file_name, self._root_dir, mode, zip_file_path
+        ) as f:
+            table = pa_csv.read_csv(
+                f,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options,
+            )
+
+        # Convert table to DataFrame, releasing Arrow buffers as columns are converted
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
     def read_excel(
         self,
         file_name: str,
@@ -782,11 +1292,14 @@ class DataLoader:
         file_name: str,
         zip_file_path: Optional[str] = None,
         **kwargs,
-    ) -> gpd.GeoDataFrame:
+    ) -> Union[gpd.GeoDataFrame, pd.DataFrame]:
         """Loads an Apache Parquet file into a Geopandas GeoDataFrame.
+        Files without GeoParquet metadata are instead converted
+        directly from Arrow into a Pandas DataFrame.
 
         References:
         - https://geopandas.org/en/stable/docs/reference/api/geopandas.read_parquet.html
+        - https://arrow.apache.org/docs/python/generated/pyarrow.parquet.read_table.html
 
         Args:
             file_name (`str`): The relative path to the file
@@ -797,16 +1310,29 @@ class DataLoader:
                 to `None`.
 
             **kwargs: Additional keywords to pass to the
-                underlying `geopandas.read_parquet` method.
+                underlying `geopandas.read_parquet` or
+                `pyarrow.parquet.read_table` method (e.g.,
+                "columns", to read only a subset of columns).
 
         Returns:
-            (`gpd.DataFrame`): The `GeoDataFrame`.
+            (`gpd.GeoDataFrame` | `pd.DataFrame`): The `GeoDataFrame`,
+                or the `DataFrame` if the file holds no geometries.
         """
         mode = "r" if zip_file_path else "rb"
         with self._file_helper.open_file(
             file_name, self._root_dir, mode, zip_file_path
         ) as f:
-            return gpd.read_parquet(f, **kwargs)
+            # Determine from the file footer whether the data is geospatial
+            metadata = pq.read_schema(f).metadata or {}
+            f.seek(0)
+
+            # Decode geometries if present
+            if b"geo" in metadata:
+                return gpd.read_parquet(f, **kwargs)
+
+            # Otherwise, convert the Arrow table without intermediate copies
+            table = pq.read_table(f, **kwargs)
+            return table.to_pandas(split_blocks=True, self_destruct=True)
 
     def read_shapefile(
         self,
@@ -814,10 +1340,14 @@ class DataLoader:
         zip_file_path: Optional[str] = None,
         **kwargs,
     ) -> gpd.GeoDataFrame:
-        """Loads a Shapefile into a Geopandas GeoDataFrame.
+        """Loads a Shapefile into a Geopandas GeoDataFrame. Records
+        are read through Apache Arrow, which transfers the data
+        to Python in columnar batches rather than one feature at
+        a time and is therefore considerably faster for large files.
 
         References:
         - https://geopandas.org/en/stable/docs/reference/api/geopandas.read_file.html
+        - https://pyogrio.readthedocs.io/en/latest/introduction.html#read-a-data-source-into-an-arrow-table
 
         Args:
             file_name (`str`): The relative path to the file
@@ -828,7 +1358,10 @@ class DataLoader:
                 to `None`.
 
             **kwargs: Additional keywords to pass to the
-                underlying `geopandas.read_file` method.
+                underlying `geopandas.read_file` method (e.g.,
+                "columns", to read only a subset of attribute
+                fields, or "read_geometry", to skip parsing
+                geometries and return a `pd.DataFrame` instead).
 
         Returns:
             (`gpd.DataFrame`): The `GeoDataFrame`.
@@ -837,21 +1370,69 @@ class DataLoader:
         # if there is no need to reference subdirectories of a zipfile
         if not zip_file_path:
             with self._file_helper.open_file(file_name, self._root_dir, mode="rb") as f:
-                return gpd.read_file(f, engine="pyogrio")
+                return gpd.read_file(f, engine="pyogrio", use_arrow=True, **kwargs)
+
+        # Read zipped dataset in place if it is already on the local file system
+        if isinstance(self._file_helper, LocalFileSystemHelper):
+            data_fpath = f"{Path(self._root_dir) / file_name}!{zip_file_path}"
+            return gpd.read_file(data_fpath, engine="pyogrio", use_arrow=True, **kwargs)
 
         # Otherwise, create temp directory
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Open new file in directory and transfer contents of remote zipfile
+            # Open new file in directory and stream contents of remote zipfile
             tmp_fpath = f"{temp_dir}/tmp.zip"
             with open(tmp_fpath, "wb") as tmp:
                 with self._file_helper.open_file(
                     file_name, self._root_dir, mode="rb"
                 ) as f:
-                    tmp.write(f.read())
+                    shutil.copyfileobj(f, tmp)
 
             # Read the zipped dataset as GeoDataFrame
             data_fpath = f"{tmp_fpath}!{zip_file_path}"
-            return gpd.read_file(data_fpath, engine="pyogrio")
+            return gpd.read_file(data_fpath, engine="pyogrio", use_arrow=True, **kwargs)
+
+    def read_shapefiles(
+        self,
+        glob_pattern: str,
+        max_workers: int = settings.SHAPEFILE_READ_MAX_WORKERS,
+        **kwargs,
+    ) -> gpd.GeoDataFrame:
+        """Loads all Shapefiles within the root directory matching the
+        given glob pattern into a single Geopandas GeoDataFrame. Files
+        are read concurrently by a pool of threads, which overlap I/O
+        and parsing because GDAL releases the GIL, and are then
+        concatenated in a single pass.
+
+        Args:
+            glob_pattern (`str`): A relative path to search
+                for within the directory. May contain
+                shell-like wildcards.
+
+            max_workers (`int`): The maximum number of files to
+                read at once. Defaults to the value configured
+                in the Django settings module.
+
+            **kwargs: Additional keywords to pass to the
+                underlying `DataLoader.read_shapefile` method.
+
+        Raises:
+            (`FileNotFoundError`) if no files match the pattern.
+
+        Returns:
+            (`gpd.DataFrame`): The `GeoDataFrame`.
+        """
+        # Find matching files
+        fpaths = self.list_directory_contents(glob_pattern)
+        if not fpaths:
+            raise FileNotFoundError(f'No files found matching "{glob_pattern}".')
+
+        # Read files concurrently, preserving their order
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            gdfs = list(
+                executor.map(lambda pth: self.read_shapefile(pth, **kwargs), fpaths)
+            )
+
+        return pd.concat(gdfs)
 
 
 class DataWriter:
@@ -876,15 +1457,51 @@ class DataWriter:
         self._root_dir = root_dir
         self._file_helper = FileSystemHelperFactory.get()
 
+    def write_json(
+        self,
+        file_name: str,
+        data: Any,
+        zip_file_path: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        """Writes a JSON file to the designated file
+        path within the root directory.
+
+        Args:
+            file_name (`str`): The relative path to the file
+                within the root directory.
+
+            data (`Any`): The JSON-serializable data.
+
+            zip_file_path (`str`|`None`): The path to the file
+                within a zip folder, if applicable. Defaults
+                to `None`.
+
+            **kwargs: Additional keywords to pass to the
+                underlying `json.dumps` method.
+
+        Returns:
+            `None`
+        """
+        content = json.dumps(data, **kwargs)
+        with self._file_helper.open_file(
+            file_name, self._root_dir, "w", zip_file_path
+        ) as f:
+            f.write(content.encode() if zip_file_path else content)
+
     def write_geojsonl(
         self,
         file_name: str,
         data: gpd.GeoDataFrame,
         zip_file_path: Optional[str] = None,
         index: bool = False,
+        precision: Optional[int] = None,
     ) -> None:
         """Writes a line-delimited GeoJSON file to the
         designated file path within the root directory.
+        Features are serialized and written in chunks of
+        `settings.GEOJSONL_WRITE_CHUNK_SIZE` rows to bound
+        memory use.
 
         Args:
             file_name (`str`): The relative path to the file
@@ -900,23 +1517,56 @@ class DataWriter:
                 should be kept in the output GeoJSON lines.
                 Defaults to `False`.
 
+            precision (`int` | `None`): The number of decimal places
+                to which coordinates are rounded before serialization,
+                which reduces output file size. Defaults to `None`,
+                in which case full precision is preserved.
+
         Returns:
             `None`
         """
-        counter = 0
-        num_features = len(data)
-        mode = "w"
-        parse_row = lambda r: (
-            json.dumps(r).encode() if zip_file_path else json.dumps(r)
+        # Define helper to serialize one feature per line
+        parse_row = lambda props, geom: (
+            '{"type": "Feature", '
+            f'"properties": {json.dumps(props)}, '
+            f'"geometry": {geom if geom is not None else "null"}}}'
         )
+
+        # Serialize and write features in bounded chunks, so that only one
+        # chunk's worth of converted properties and lines is held in memory
+        mode = "w"
+        chunk_size = settings.GEOJSONL_WRITE_CHUNK_SIZE
         with self._file_helper.open_file(
             file_name, self._root_dir, mode, zip_file_path
         ) as f:
-            for row in data.iterfeatures(drop_id=True):
-                f.write(parse_row(row))
-                counter += 1
-                if counter != num_features:
-                    f.write("\n")
+            for start in range(0, len(data), chunk_size):
+                chunk = data.iloc[start : start + chunk_size]
+
+                # Round coordinates in a single vectorized pass if indicated
+                geometries = chunk.geometry.values
+                if precision is not None:
+                    geometries = shapely.transform(
+                        geometries, lambda c: np.round(c, precision)
+                    )
+
+                # Serialize geometries to GeoJSON in a single vectorized
+                # pass rather than building a feature dictionary per row
+                geometries = shapely.to_geojson(geometries)
+
+                # Convert properties to native Python types, replacing nulls
+                properties = chunk.drop(columns=chunk.geometry.name)
+                properties = properties.astype(object).where(properties.notna(), None)
+
+                # Build chunk's lines and write them in a single call
+                content = "\n".join(
+                    parse_row(props, geom)
+                    for props, geom in zip(
+                        properties.to_dict(orient="records"), geometries
+                    )
+                )
+                if start:
+                    content = "\n" + content
+                f.write(content.encode() if zip_file_path else content)
 
     def write_geoparquet(
         self,
@@ -926,7 +1576,9 @@ class DataWriter:
         index: bool = False,
     ) -> None:
         """Writes a geoparquet file to the designated
-        file path within the root directory.
+        file path within the root directory. The file is
+        compressed and split into row groups as configured
+        in the Django settings module.
 
         Args:
             file_name (`str`): The relative path to the file
@@ -949,4 +1601,9 @@ class DataWriter:
         with self._file_helper.open_file(
             file_name, self._root_dir, mode, zip_file_path
         ) as f:
-            data.to_parquet(f, index=index)
+            data.to_parquet(
+                f,
+                index=index,
+                compression=settings.GEOPARQUET_COMPRESSION,
+                row_group_size=settings.GEOPARQUET_ROW_GROUP_SIZE,
+            )
@@ -24,10 +24,23 @@ class BaseConfig(Configuration):
     DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
     # Define default settings for batching and bulk operations
-    PQ_CHUNK_SIZE = 1_000
+    PQ_CHUNK_SIZE = 65_536
+    SHAPEFILE_READ_MAX_WORKERS = 8
+    FILE_METADATA_MAX_WORKERS = 16
+    CSV_READ_BLOCK_SIZE = 16 * 1024 * 1024
+    GCS_READ_CHUNK_SIZE = 8 * 1024 * 1024
+    GCS_PARALLEL_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024
+    GCS_PARALLEL_DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+    GCS_PARALLEL_DOWNLOAD_MAX_WORKERS = 8
+    GCS_HTTP_POOL_SIZE = 32
     DB_REPLICATION_CHUNK_SIZE = 10_000
     EXPONENTIAL_SMOOTHING_FACTOR = 0.1
     TARGET_SECONDS_PER_BATCH = 5
+    INITIAL_BULK_INSERT_BATCH_SIZE = 500
+    MAX_BULK_INSERT_BATCH_SIZE = 10_000
+    COPY_INSERT_CHUNK_SIZE = 1_000
+    VALUES_INSERT_PAGE_SIZE = 1_000
+    LOAD_ASSOCIATIONS_MAX_WORKERS = 4
     SLOW_LOAD_THRESHOLD_IN_MINUTES = 1
 
     # Define settings to generate population-weighted centroid datasets
@@ -49,8 +62,13 @@ class BaseConfig(Configuration):
 
     # Define settings to process raw datasets
     BUFFER_DEG = -10e-20
+    CLEAN_DATA_MAX_WORKERS = 4
+    GEOJSONL_COORDINATE_PRECISION = 6
     GEOJSONL_DIRECTORY = "clean/geojsonl"
+    GEOJSONL_WRITE_CHUNK_SIZE = 10_000
+    GEOPARQUET_COMPRESSION = "zstd"
     GEOPARQUET_DIRECTORY = "clean/geoparquet"
+    GEOPARQUET_ROW_GROUP_SIZE = 50_000
     RAW_DATASETS = [
         {
             "name": "counties",
@@ -233,9 +251,11 @@ class BaseConfig(Configuration):
     ]
 
     # Define settings to sync cleaned data files with remote Mapbox tilesets
+    MAPBOX_HTTP_MAX_WORKERS = 8
     MAPBOX_TILEJSON_METADATA_FILE = "clean/mapbox/mapbox_tilesets.json"
     MAPBOX_TILESET_PUBLISH_SECONDS_WAIT = 10
     MAPBOX_TILESET_SOURCE_BATCH_SIZE = 10000
+    MAPBOX_TILESET_SYNC_MAX_WORKERS = 4
     MAPBOX_TILESETS = [
         {
             "formal_name": "cc_counties",
@@ -3,17 +3,19 @@
 
 # Standard library imports
 import io
+import itertools
 import json
 import os
 import requests
-import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from types import TracebackType
 from typing import Dict, List, Optional
 from typing_extensions import Self, Type
 
 # Third-party imports
 from django.conf import settings
+from requests.adapters import HTTPAdapter
 
 # Application imports
 from common.logger import logging
@@ -48,6 +50,13 @@ class MapboxTilingApiClient:
                 f'Missing required environment variable "{e}".'
             )
 
+        # Open session to reuse pooled connections across requests
+        pool_size = settings.MAPBOX_HTTP_MAX_WORKERS
+        self._session = requests.Session()
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        )
+
     def _build_query_params(self, fields: BaseFieldset) -> Dict:
         """Builds HTTP URL query parameters for every model
         field that contains a "name" property.
@@ -107,7 +116,7 @@ class MapboxTilingApiClient:
         params = self._build_query_params(fields)
 
         # Make request
-        r = requests.post(url, params=params, files={"file": fields.file.value})
+        r = self._session.post(url, params=params, files={"file": fields.file.value})
         if not r.ok:
             raise RuntimeError(
                 "The request to create a new tileset source "
@@ -203,7 +212,7 @@ class MapboxTilingApiClient:
         params = self._build_query_params(fields)
 
         # Make request
-        r = requests.post(url, params=params, json=body)
+        r = self._session.post(url, params=params, json=body)
         if not r.ok:
             raise RuntimeError(
                 "The request to create a new tileset "
@@ -243,7 +252,7 @@ class MapboxTilingApiClient:
         params = self._build_query_params(fields)
 
         # Make request
-        r = requests.delete(url, params=params)
+        r = self._session.delete(url, params=params)
         if not r.ok:
             raise RuntimeError(
                 "The request to delete the tileset "
@@ -286,7 +295,7 @@ class MapboxTilingApiClient:
         params = self._build_query_params(fields)
 
         # Make request
-        r = requests.delete(url, params=params)
+        r = self._session.delete(url, params=params)
         if not r.ok:
             raise RuntimeError(
                 "The request to delete the tileset source "
@@ -328,7 +337,7 @@ class MapboxTilingApiClient:
         params = self._build_query_params(fields)
 
         # Make request
-        r = requests.get(url, params=params)
+        r = self._session.get(url, params=params)
         if not r.ok:
             raise RuntimeError(
                 "The request to fetch TileJSON metadata for "
@@ -375,7 +384,7 @@ class MapboxTilingApiClient:
         params = self._build_query_params(fields)
 
         # Make request
-        r = requests.get(url, params=params)
+        r = self._session.get(url, params=params)
         if not r.ok:
             raise RuntimeError(
                 "The request to fetch tileset processing job "
@@ -442,7 +451,7 @@ class MapboxTilingApiClient:
         params = self._build_query_params(fields)
 
         # Make request
-        r = requests.get(url, params=params)
+        r = self._session.get(url, params=params)
         if not r.ok:
             raise RuntimeError(
                 "The request to list tileset job metadata "
@@ -498,7 +507,7 @@ class MapboxTilingApiClient:
         params = self._build_query_params(fields)
 
         # Make request
-        r = requests.get(url, params=params)
+        r = self._session.get(url, params=params)
         if not r.ok:
             raise RuntimeError(
                 "The request to list tileset sources for user "
@@ -564,7 +573,7 @@ class MapboxTilingApiClient:
         params = self._build_query_params(fields)
 
         # Make request
-        r = requests.get(url, params=params)
+        r = self._session.get(url, params=params)
         if not r.ok:
             raise RuntimeError(
                 "The request to list tilesets for user "
@@ -607,7 +616,7 @@ class MapboxTilingApiClient:
         params = self._build_query_params(fields)
 
         # Make request
-        r = requests.post(url, params=params)
+        r = self._session.post(url, params=params)
         if not r.ok:
             raise RuntimeError(
                 "The request to publish the tileset "
@@ -690,7 +699,7 @@ class MapboxTilingApiClient:
         params = self._build_query_params(fields)
 
         # Make request
-        r = requests.patch(url, params=params, json=body)
+        r = self._session.patch(url, params=params, json=body)
         if not r.ok:
             raise RuntimeError(
                 "The request to update the tileset "
@@ -779,11 +788,14 @@ class MapboxTilesetSyncClient:
 
         # Fetch metadata
         self._logger.info("Fetching tilesets' TileJSON metadata.")
-        all_metadata = []
-        for tileset in self._client.list_tilesets():
-            tileset_formal_name = tileset["id"].split(".")[-1]
-            metadata = self._client.get_tilejson_metadata(tileset_formal_name)
-            all_metadata.append(metadata)
+        tilesets = self._client.list_tilesets()
+        formal_names = [tileset["id"].split(".")[-1] for tileset in tilesets]
+        with ThreadPoolExecutor(
+            max_workers=settings.MAPBOX_HTTP_MAX_WORKERS
+        ) as executor:
+            all_metadata = list(
+                executor.map(self._client.get_tilejson_metadata, formal_names)
+            )
 
         # Write metadata to file
         self._logger.info("Persisting TileJSON metadata to file.")
@@ -811,35 +823,31 @@ class MapboxTilesetSyncClient:
 
         # Initialize settings for limiting no. of GeoJSON lines sent to server
         batch_size = settings.MAPBOX_TILESET_SOURCE_BATCH_SIZE
-        end_of_file = False
 
         # Process file
         with self._file_helper.open_file(fpath) as f:
-            while not end_of_file:
-                # Write temp file with line count up to batch size
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    self._logger.info("Writing partial file contents to temp file.")
-                    tmp_fpath = f"{temp_dir}/tmp.geojsonl"
-                    with open(tmp_fpath, "w") as tmp:
-                        for _ in range(batch_size):
-                            line = f.readline()
-                            if not line:
-                                end_of_file = True
-                                break
-                            tmp.write(line)
-                            tmp.write("\n")
-
-                    # Upload temp file to Mapbox tileset source
-                    self._logger.info(f"Uploading temp file to Mapbox.")
-                    with open(tmp_fpath, "r") as tmp:
-                        self._client.create_or_append_tileset_source(
-                            source_id=source_id, file=tmp
-                        )
+            while True:
+                # Read lines up to batch size
+                lines = [line.rstrip("\n") for line in itertools.islice(f, batch_size)]
+                if not lines:
+                    break
+
+                # Upload lines to Mapbox tileset source as a single in-memory file
+                self._logger.info(
+                    f"Uploading batch of {len(lines):,} feature(s) to Mapbox."
+                )
+                batch = io.StringIO("\n".join(lines))
+                batch.name = "batch.geojsonl"
+                self._client.create_or_append_tileset_source(
+                    source_id=source_id, file=batch
+                )
 
     def _delete_tileset_sources(self) -> None:
         """Deletes all existing tileset sources on
         the Mapbox server side for the account given
-        by environment variable settings.
+        by environment variable settings. Deletions
+        are independent of one another and are therefore
+        requested concurrently.
 
         Args:
             `None`
@@ -847,11 +855,27 @@ class MapboxTilesetSyncClient:
         Returns:
             `None`
         """
-        for source in self._client.list_tileset_sources():
-            source_id = source["id"].split("/")[-1]
+
+        def delete_source(source_id: str) -> None:
+            """Deletes a single tileset source.
+
+            Args:
+                source_id (`str`): The tileset source id.
+
+            Returns:
+                `None`
+            """
             self._logger.info(f'Deleting pre-existing tileset source "{source_id}".')
             self._client.delete_tileset_source(source_id)
 
+        # Delete all sources concurrently
+        sources = self._client.list_tileset_sources()
+        source_ids = [source["id"].split("/")[-1] for source in sources]
+        with ThreadPoolExecutor(
+            max_workers=settings.MAPBOX_HTTP_MAX_WORKERS
+        ) as executor:
+            list(executor.map(delete_source, source_ids))
+
     def _monitor_tileset_publishing_job(
         self, tileset_formal_name: str, job_id: str
     ) -> None:
@@ -1,6 +1,9 @@
 """Syncs tileset data in the datastore with that in Mapbox.
 """
 
+# Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+
 # Third-party imports
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandParser
@@ -63,6 +66,9 @@ class Command(BaseCommand):
         """Executes the command. If the "geos" option
         has been provided, only the listed datasets
         are synced. Otherwise, all datasets are synced.
+        Tilesets are independent of one another and spend
+        most of their sync waiting on uploads and publishing
+        jobs, so they are synced in parallel threads.
 
         Args:
             `None`
@@ -73,15 +79,25 @@ class Command(BaseCommand):
         # Log start of command
         self._logger.info("Received command to sync Mapbox tilesets from data.")
 
-        # Process each configured geography type
+        # Select configured geography types to process
         geos = options["geos"]
+        configs = [
+            config
+            for config in settings.MAPBOX_TILESETS
+            if not geos or config["display_name"] in geos
+        ]
+
+        # Sync each selected geography type concurrently
         with MapboxTilesetSyncClient(self._logger) as client:
-            for config in settings.MAPBOX_TILESETS:
-                if geos and config["display_name"] not in geos:
-                    continue
-                else:
+            with ThreadPoolExecutor(
+                max_workers=settings.MAPBOX_TILESET_SYNC_MAX_WORKERS
+            ) as executor:
+                futures = [
+                    executor.submit(client.sync_tileset, **config) for config in configs
+                ]
+                for config, future in zip(configs, futures):
                     try:
-                        client.sync_tileset(**config)
+                        future.result()
                     except RuntimeError as e:
                         self._logger.error(
                             f"Failed to process dataset "
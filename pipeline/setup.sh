@@ -46,42 +46,21 @@ if $migrate ; then
     yes | ./manage.py migrate
 fi
 
-# Generate cleaned datasets if indicated
-if $clean_data ; then
-    echo "Generating geography datasets from raw data files."
-    ./manage.py clean_data
-fi
-
-# Load cleaned geographies into database if indicated
-if $load_geos ; then
-    echo "Loading geographies into database."
-    ./manage.py load_geos
-fi
-
-# Compute and load associations between target and bonus geographies if indicated
-if $load_associations ; then
-    echo "Loading association table into database."
-    ./manage.py load_associations
-fi
-
-# Replicate
-if $replicate_database; then    
-    echo "Applying migrations to production database used for web app."
-    yes | ./manage.py migrate --database=resized
-
-    echo "Replicating tables in current database to production database."
-    yes | ./manage.py replicate_database
+# Run indicated data pipeline stages within a single Python process
+stages=()
+$clean_data && stages+=(--clean-data)
+$load_geos && stages+=(--load-geos)
+$load_associations && stages+=(--load-associations)
+$replicate_database && stages+=(--replicate-database)
+$sync_mapbox && stages+=(--sync-mapbox)
+if [ ${#stages[@]} -gt 0 ] ; then
+    echo "Running pipeline stages: ${stages[*]}."
+    ./manage.py run_pipeline "${stages[@]}"
 fi
 
 # Log successful end of database setup
 echo "Database setup completed successfully."
 
-# Update Mapbox tilesets to match cleaned geographies if indicated
-if $sync_mapbox ; then
-    echo "Syncing remote Mapbox tilesets with lastest cleaned geographies."
-    ./manage.py sync_tilesets
-fi
-
 # Run development server if indicated
 if $run_server ; then
     echo "Running default development server."
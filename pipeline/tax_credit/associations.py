@@ -2,7 +2,7 @@
 """
 
 # Standard library imports
-from typing import Dict, List
+from typing import Callable, Dict, List, Tuple
 
 # Third-party imports
 import geopandas as gpd
@@ -61,6 +61,20 @@ class AssociationsService:
             `None`
         """
         self._population_service = population_service
+        self._match_strategies: Dict[Tuple[str, str], Callable[[str, str], List]] = {
+            **{
+                option: lambda _, bonus_type: self.find_within_states(bonus_type)
+                for option in self.STATE_FIPS_MATCH_OPTIONS
+            },
+            **{
+                option: lambda _, bonus_type: self.find_within_counties(bonus_type)
+                for option in self.COUNTY_FIPS_MATCH_OPTIONS
+            },
+            **{
+                option: self.find_within_spatial_intersection
+                for option in self.SPATIAL_OVERLAP_MATCH_OPTIONS
+            },
+        }
 
     def find_bonus_matches(self, target_type: str, bonus_type: str) -> List[Dict]:
         """Finds tax credit bonus geography records that "match"
@@ -75,31 +89,21 @@ class AssociationsService:
         Returns:
             (`list` of `Dict`): The bonus geography matches.
         """
-        lookup_key = (target_type, bonus_type)
-
-        if lookup_key in self.STATE_FIPS_MATCH_OPTIONS:
-            return self.find_within_states(bonus_type)
-
-        elif lookup_key in self.COUNTY_FIPS_MATCH_OPTIONS:
-            return self.find_within_counties(bonus_type)
-
-        elif lookup_key in self.SPATIAL_OVERLAP_MATCH_OPTIONS:
-            return self.find_within_spatial_intersection(target_type, bonus_type)
-
-        else:
+        # Look up matching strategy for geography type combination
+        try:
+            strategy = self._match_strategies[(target_type, bonus_type)]
+        except KeyError:
             all_options = [
                 f"Target: {target}, Bonus: {bonus}"
-                for target, bonus in (
-                    self.STATE_FIPS_MATCH_OPTIONS
-                    + self.COUNTY_FIPS_MATCH_OPTIONS
-                    + self.SPATIAL_OVERLAP_MATCH_OPTIONS
-                )
+                for target, bonus in self._match_strategies
             ]
             raise ValueError(
                 "Received an unexpected combination of target and bonus "
-                f"geography types: Target ({target_type}), Bonus (bonus_type). "
+                f"geography types: Target ({target_type}), Bonus ({bonus_type}). "
                 f"Expected one of the following instead: {'; '.join(all_options)}."
-            )
+            ) from None
+
+        return strategy(target_type, bonus_type)
 
     def find_within_counties(self, bonus_type: str) -> List[Dict]:
         """Finds intersections between counties and records of
@@ -142,7 +146,13 @@ class AssociationsService:
         """Finds spatial intersections between geographies
         of the target type and geographies of the bonus type
         while excluding cases where the borders touch or
-        barely overlap due to geometry imprecisions.
+        barely overlap due to geometry imprecisions. Candidate
+        pairs are pruned by bounding box through the spatial index
+        probe that `ST_INTERSECTS` performs internally, and the
+        intersection of each remaining pair is then computed only once.
+        Because a single target geography (e.g., a state) may overlap
+        thousands of bonus geographies, target areas are computed once
+        per target rather than once per candidate pair.
 
         Args:
             bonus_type (`str`): The type of bonus geographies to search.
@@ -154,24 +164,30 @@ class AssociationsService:
         with connection.cursor() as cursor:
             cursor.execute(
                 """
+                WITH target AS MATERIALIZED (
+                    SELECT id, population, geometry, ST_AREA(geometry) AS area
+                    FROM tax_credit_geography
+                    WHERE geography_type = %s
+                )
                 SELECT
                     target.id AS target_id,
                     target.population AS target_population,
                     bonus.id AS bonus_id,
                     bonus.population AS bonus_population,
-                    ST_COLLECTIONEXTRACT(
-                        ST_INTERSECTION(target.geometry, bonus.geometry), 3
-                    ) AS geometry,
-                    ST_SRID(target.geometry) AS srid
-                FROM tax_credit_geography target, tax_credit_geography bonus
-                WHERE (
-                    target.geography_type = %s AND
-                    bonus.geography_type = %s AND
-                    ST_INTERSECTS(target.geometry, bonus.geometry) AND
-                    (
-                        ST_AREA(ST_INTERSECTION(target.geometry, bonus.geometry)) / 
-                        LEAST(ST_AREA(target.geometry), ST_AREA(bonus.geometry)) > %s
+                    ST_COLLECTIONEXTRACT(overlap.geometry, 3) AS geometry
+                FROM target
+                JOIN tax_credit_geography bonus
+                    ON (
+                        bonus.geography_type = %s AND
+                        ST_INTERSECTS(target.geometry, bonus.geometry)
                     )
+                CROSS JOIN LATERAL (
+                    SELECT ST_INTERSECTION(target.geometry, bonus.geometry) AS geometry
+                    OFFSET 0
+                ) overlap
+                WHERE (
+                    ST_AREA(overlap.geometry) /
+                    LEAST(target.area, ST_AREA(bonus.geometry)) > %s
                 );
                 """,
                 [target_type, bonus_type, settings.INTERSECTION_AREA_THRESHOLD_DEG],
@@ -182,8 +198,8 @@ class AssociationsService:
         if not matches:
             return []
 
-        # Otherwise, read records into GeoDataFrame
-        crs = f"EPSG:{matches[0][-1]}"
+        # Otherwise, read records into GeoDataFrame using the geometry column's SRID
+        crs = f"EPSG:{Geography._meta.get_field('geometry').srid}"
         df = pd.DataFrame(
             matches,
             columns=[
@@ -192,15 +208,15 @@ class AssociationsService:
                 "bonus_id",
                 "bonus_population",
                 "geometry",
-                "srid",
             ],
         )
-        df["geometry"] = df["geometry"].apply(shapely.from_wkb)
+        df["geometry"] = shapely.from_wkb(df["geometry"].to_numpy())
         gdf = gpd.GeoDataFrame(df, geometry="geometry", crs=crs)
 
-        # Join records with population-weighted centroids to aggregate population counts
-        gdf["id"] = gdf["target_id"].astype(str) + ", " + gdf["bonus_id"].astype(str)
-        merged_gdf = self._population_service.centroids_sjoin(gdf, id_col="id")
+        # Join records with population-weighted centroids to aggregate population
+        # counts. Each record is a distinct target-bonus pair, so no identifier
+        # is needed to combine counts across records.
+        merged_gdf = self._population_service.centroids_sjoin(gdf)
 
         # Ensure population estimate isn't greater than those of overlapping geographies
         merged_gdf["population"] = merged_gdf[
@@ -2,24 +2,25 @@
 """
 
 # Standard library imports
+import hashlib
+import importlib
+import json
 import logging
 import warnings
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional
 
 # Third-party imports
 import geopandas as gpd
 import numpy as np
 import pandas as pd
 from django.conf import settings
-from shapely.geometry.multipolygon import MultiPolygon
-from shapely.geometry.polygon import Polygon
 
 # Application imports
 from common.storage import DataLoader, DataWriter
 from tax_credit.constants import STATE_ABBREVIATIONS
-from tax_credit.models import Geography
+from tax_credit.models import Geography, to_multipolygons
 from tax_credit.population import PopulationService
 
 
@@ -76,6 +77,121 @@ class GeoDataset(ABC):
         """A boolean indicating whether the dataset is currently null."""
         return self.data is None
 
+    @property
+    def file_stem(self) -> str:
+        """The dataset name formatted for use in output file names."""
+        return "_".join(self.name.replace("-", "_").split(" "))
+
+    @property
+    def manifest_fpath(self) -> str:
+        """The path to the file recording the build key of the output files."""
+        return f"{settings.GEOPARQUET_DIRECTORY}/{self.file_stem}.manifest.json"
+
+    def build_key(self, **kwargs) -> Optional[Dict[str, Any]]:
+        """Builds a key identifying the inputs and code from which the
+        dataset's output files are produced. The key consists of the
+        path, modification time and size of every input file, including
+        those read by the population service, and a version hash of the
+        cleaning and serialization code and the settings they use.
+
+        Args:
+            **kwargs: The relative paths to the dataset's input
+                files, which may contain shell-like wildcards.
+
+        Returns:
+            (`dict` | `None`): The key, or `None` if any input
+                file could not be found.
+        """
+        # Gather input file paths, including population service inputs
+        patterns = list(kwargs.values()) + [
+            pth
+            for name, pth in settings.POPULATION_SERVICE.items()
+            if name.endswith("_fpath")
+        ]
+
+        # Record path, modification time and size of each input file
+        inputs = []
+        for pattern in patterns:
+            stats = self.reader.get_stats(pattern)
+            if not stats:
+                return None
+            inputs.extend([list(stat) for stat in stats])
+
+        # Hash source code of modules used to clean and serialize data
+        digest = hashlib.sha256()
+        for module_name in (
+            __name__,
+            "common.storage",
+            "tax_credit.constants",
+            "tax_credit.models",
+            "tax_credit.population",
+        ):
+            with open(importlib.import_module(module_name).__file__, "rb") as f:
+                digest.update(f.read())
+
+        # Hash dataset configuration and settings affecting outputs
+        config = {
+            "dataset": {
+                "name": self.name,
+                "as_of": self.as_of,
+                "geography_type": self.geography_type,
+                "epsg": self.epsg,
+                "published_on": self.published_on,
+                "source": self.source,
+            },
+            "BUFFER_DEG": settings.BUFFER_DEG,
+            "GEOJSONL_COORDINATE_PRECISION": settings.GEOJSONL_COORDINATE_PRECISION,
+            "GEOPARQUET_COMPRESSION": settings.GEOPARQUET_COMPRESSION,
+            "GEOPARQUET_ROW_GROUP_SIZE": settings.GEOPARQUET_ROW_GROUP_SIZE,
+            "POPULATION_SERVICE": settings.POPULATION_SERVICE,
+        }
+        digest.update(json.dumps(config, sort_keys=True, default=str).encode())
+
+        return {"inputs": inputs, "code_version": digest.hexdigest()}
+
+    def is_current(self, **kwargs) -> bool:
+        """Determines whether the dataset's cleaned output files exist
+        and were built from the same inputs and code as would be used
+        now, in which case processing can be skipped.
+
+        Args:
+            **kwargs: The relative paths to the dataset's input
+                files, which may contain shell-like wildcards.
+
+        Returns:
+            (`bool`): `True` if the output files are up to date.
+        """
+        # Confirm output files exist
+        output_fpaths = [
+            f"{settings.GEOPARQUET_DIRECTORY}/{self.file_stem}.geoparquet",
+            f"{settings.GEOJSONL_DIRECTORY}/{self.file_stem}.geojsonl",
+        ]
+        if not all(self.reader.get_stats(pth) for pth in output_fpaths):
+            return False
+
+        # Load key recorded when output files were last written
+        try:
+            manifest = self.reader.read_json(self.manifest_fpath)
+        except FileNotFoundError:
+            return False
+
+        # Compare against key for current inputs and code
+        key = self.build_key(**kwargs)
+        return key is not None and manifest == key
+
+    def write_manifest(self, key: Dict[str, Any]) -> None:
+        """Records the build key of the dataset's output files.
+        Should be called only after both output files are written.
+
+        Args:
+            key (`dict`): The key returned by `build_key`
+                before the dataset was processed.
+
+        Returns:
+            `None`
+        """
+        self.writer.write_json(self.manifest_fpath, key)
+
     @abstractmethod
     def _load_and_aggregate(self, **kwargs) -> gpd.GeoDataFrame:
         """Loads and aggregates one or more input data files
@@ -141,14 +257,13 @@ class GeoDataset(ABC):
         """
         try:
             # Convert geometries into Shapely MultiPolygons
-            trans = lambda b: MultiPolygon([b]) if isinstance(b, Polygon) else b
-            self.data["geometry"] = self.data["geometry"].apply(trans)
+            self.data["geometry"] = to_multipolygons(self.data["geometry"])
 
             # Change CRS to EPSG:4326 (geographic)
             self.data = self.data.set_crs(epsg=int(self.epsg))
             self.data = self.data.to_crs(epsg=4326)
 
-            return self.data.copy()
+            return self.data.copy(deep=False)
 
         except Exception as e:
             raise Exception(f"Failed to correct geometry column. {e}") from None
@@ -164,7 +279,7 @@ class GeoDataset(ABC):
         Returns:
             (`GeoDataFrame`): A snapshot of the current data.
         """
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _reshape_data(self) -> gpd.GeoDataFrame:
         """Adds metadata as new columns, subsets columns, and sorts
@@ -176,10 +291,36 @@ class GeoDataset(ABC):
         Returns:
             (`GeoDataFrame`): A snapshot of the current data.
         """
-        self.data["geography_type"] = self.geography_type
-        self.data["as_of"] = self.as_of
-        self.data["published_on"] = self.published_on
-        self.data["source"] = self.source
+        # Build metadata columns in a single frame
+        metadata = pd.DataFrame(
+            {
+                "geography_type": self.geography_type,
+                "as_of": self.as_of,
+                "published_on": self.published_on,
+                "source": self.source,
+            },
+            index=self.data.index,
+        )
+
+        # Subset columns and attach metadata in one concatenation
+        self.data = pd.concat(
+            [
+                self.data[
+                    [
+                        "name",
+                        "fips",
+                        "fips_pattern",
+                        "population",
+                        "population_strategy",
+                        "geometry",
+                    ]
+                ],
+                metadata,
+            ],
+            axis=1,
+        )
+
+        # Order columns and rows
         self.data = self.data[
             [
                 "name",
@@ -195,7 +336,7 @@ class GeoDataset(ABC):
             ]
         ]
         self.data = self.data.sort_values(by="name")
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def process(self, **kwargs) -> gpd.GeoDataFrame:
         """Loads and cleans a dataset.
@@ -247,7 +388,7 @@ class GeoDataset(ABC):
         self.logger.info("Reshaping data.")
         self._reshape_data()
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def to_geoparquet(self, index: bool = False) -> None:
         """Writes the dataset to a geoparquet file after
@@ -271,8 +412,9 @@ class GeoDataset(ABC):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot write file.")
 
-        # Make copy of DataFrame to avoid changing internal data state
-        copy = self.data.copy()
+        # Make shallow copy of DataFrame to avoid changing internal data
+        # state; its geometry column is replaced below, never edited in place
+        copy = self.data.copy(deep=False)
 
         # Buffer geometry to remove slight overlaps
         with warnings.catch_warnings():
@@ -280,16 +422,16 @@ class GeoDataset(ABC):
             copy.geometry = copy.geometry.buffer(settings.BUFFER_DEG)
 
         # Convert geometries back into Shapely MultiPolygons
-        trans = lambda b: MultiPolygon([b]) if isinstance(b, Polygon) else b
-        copy.geometry = copy.geometry.apply(trans)
+        copy.geometry = to_multipolygons(copy.geometry)
 
         # Write to file
-        fname = "_".join(self.name.replace("-", "_").split(" ")) + ".geoparquet"
-        fpath = f"{settings.GEOPARQUET_DIRECTORY}/{fname}"
+        fpath = f"{settings.GEOPARQUET_DIRECTORY}/{self.file_stem}.geoparquet"
         self.writer.write_geoparquet(fpath, copy, index=index)
 
     def to_geojson_lines(self, index: bool = False) -> None:
-        """Writes the dataset to a newline-delimited GeoJSON file.
+        """Writes the dataset to a newline-delimited GeoJSON file,
+        with coordinates rounded to the configured precision to
+        reduce the size of the files uploaded to Mapbox.
 
         References:
         - https://stevage.github.io/ndgeojson/
@@ -308,9 +450,13 @@ class GeoDataset(ABC):
             raise RuntimeError("Dataset is empty. Cannot write file.")
 
         # Write to file
-        fname = "_".join(self.name.replace("-", "_").split(" ")) + ".geojsonl"
-        fpath = f"{settings.GEOJSONL_DIRECTORY}/{fname}"
-        self.writer.write_geojsonl(fpath, self.data, index=index)
+        fpath = f"{settings.GEOJSONL_DIRECTORY}/{self.file_stem}.geojsonl"
+        self.writer.write_geojsonl(
+            fpath,
+            self.data,
+            index=index,
+            precision=settings.GEOJSONL_COORDINATE_PRECISION,
+        )
 
 
 class CoalDataset(GeoDataset):
@@ -342,9 +488,21 @@ class CoalDataset(GeoDataset):
 
         # Load file
         zip_file_path = "IRA_Coal_Closure_Energy_Comm_2023v2/Coal_Closure_Energy_Communities_SHP_2023v2"
-        self.data = self.reader.read_shapefile(coal_fpath, zip_file_path)
+        self.data = self.reader.read_shapefile(
+            coal_fpath,
+            zip_file_path,
+            columns=[
+                "CensusTrac",
+                "County_Nam",
+                "State_Name",
+                "geoid_trac",
+                "fipstate_2",
+                "fipcounty_",
+                "fiptract_2",
+            ],
+        )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_name(self) -> gpd.GeoDataFrame:
         """Updates the data with a formatted name column.
@@ -365,7 +523,7 @@ class CoalDataset(GeoDataset):
             + ", "
             + self.data["State_Name"].str.upper()
         )
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_fips(self) -> gpd.GeoDataFrame:
         """Updates the data with one or more columns storing
@@ -381,7 +539,7 @@ class CoalDataset(GeoDataset):
             raise RuntimeError("Dataset is empty. Cannot construct FIPS Codes.")
         self.data["fips"] = self.data["geoid_trac"]
         self.data["fips_pattern"] = Geography.FipsPattern.STATE_COUNTY_TRACT
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_population(self, **kwargs) -> gpd.GeoDataFrame:
         """Updates the data with a total population count column
@@ -405,7 +563,7 @@ class CoalDataset(GeoDataset):
             tract_col="fiptract_2",
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
 
 class CountyDataset(GeoDataset):
@@ -439,17 +597,19 @@ class CountyDataset(GeoDataset):
         counties = self.reader.read_shapefile(counties_fpath)
 
         # Load CSV file of U.S. county FIPS codes
-        fips = self.reader.read_csv(state_fips_fpath, delimiter="|", dtype=str)
+        fips = self.reader.read_csv(
+            state_fips_fpath, delimiter="|", usecols=["STATE", "STATE_NAME"], dtype=str
+        )
 
         # Merge counties and fip codes
         self.data = counties.merge(
-            right=fips[["STATE", "STATE_NAME"]],
+            right=fips,
             how="left",
             left_on="STATEFP",
             right_on="STATE",
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_name(self) -> gpd.GeoDataFrame:
         """Updates the data with a formatted name column.
@@ -467,7 +627,7 @@ class CountyDataset(GeoDataset):
             + ", "
             + self.data["STATE_NAME"].str.upper()
         )
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_fips(self) -> gpd.GeoDataFrame:
         """Updates the data with one or more columns storing
@@ -483,7 +643,7 @@ class CountyDataset(GeoDataset):
             raise RuntimeError("Dataset is empty. Cannot construct FIPS Codes.")
         self.data["fips"] = self.data["STATEFP"] + self.data["COUNTYFP"]
         self.data["fips_pattern"] = Geography.FipsPattern.STATE_COUNTY
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_population(self, **kwargs) -> gpd.GeoDataFrame:
         """Updates the data with a total population count column
@@ -506,7 +666,7 @@ class CountyDataset(GeoDataset):
             county_col="COUNTYFP",
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
 
 class DistressedDataset(GeoDataset):
@@ -559,7 +719,7 @@ class DistressedDataset(GeoDataset):
             right_on="Zipcode",
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_name(self) -> gpd.GeoDataFrame:
         """Updates the data with a formatted name column.
@@ -573,7 +733,7 @@ class DistressedDataset(GeoDataset):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot construct name.")
         self.data["name"] = "DISTRESSED ZCTA " + self.data["Zipcode"].str.upper()
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_fips(self) -> gpd.GeoDataFrame:
         """Updates the data with one or more columns storing
@@ -588,7 +748,7 @@ class DistressedDataset(GeoDataset):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot construct FIPS Codes.")
         self.data["fips"] = self.data["fips_pattern"] = None
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _filter_records(self) -> gpd.GeoDataFrame:
         """Filters the dataset to contain only relevant entries
@@ -603,7 +763,7 @@ class DistressedDataset(GeoDataset):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot filter records.")
         self.data = self.data.query("`Quintile (5=Distressed)` == '5'")
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_population(self, **kwargs) -> gpd.GeoDataFrame:
         """Updates the data with a population column. Populations
@@ -625,7 +785,7 @@ class DistressedDataset(GeoDataset):
             zcta_col="ZCTA5CE20",
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
 
 class FossilFuelDataset(GeoDataset):
@@ -659,16 +819,18 @@ class FossilFuelDataset(GeoDataset):
         zip_file_path = (
             "MSA_NMSA_FEE_EC_Status_2023v2/MSA_NMSA_FEE_EC_Status_SHP_2023v2"
         )
-        gdf = self.reader.read_shapefile(fossil_fuel_fpath, zip_file_path)
-
-        # Subset data to include only column relevant to
-        # metropolitan statistical areas (MSAs, the unit of analysis)
-        gdf = gdf[["EC_qual_st", "msa_qual", "MSA_area_n", "geometry"]]
+        # NOTE: Only columns relevant to metropolitan statistical
+        # areas (MSAs, the unit of analysis) are read from the file
+        gdf = self.reader.read_shapefile(
+            fossil_fuel_fpath,
+            zip_file_path,
+            columns=["EC_qual_st", "msa_qual", "MSA_area_n"],
+        )
 
         # Group rows (counties) by MSA name
-        self.data = gdf.groupby(by="MSA_area_n").first().reset_index()
+        self.data = gdf.groupby(by="MSA_area_n", sort=False).first().reset_index()
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_name(self) -> gpd.GeoDataFrame:
         """Updates the data with a formatted name column.
@@ -706,7 +868,7 @@ class FossilFuelDataset(GeoDataset):
 
         self.data["name"] = self.data.apply(parse_row, axis=1)
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_fips(self) -> gpd.GeoDataFrame:
         """Updates the data with one or more columns storing
@@ -721,7 +883,7 @@ class FossilFuelDataset(GeoDataset):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot construct FIPS Codes.")
         self.data["fips"] = self.data["fips_pattern"] = None
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _filter_records(self) -> gpd.GeoDataFrame:
         """Filters the dataset to contain only relevant entries.
@@ -737,7 +899,7 @@ class FossilFuelDataset(GeoDataset):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot filter records.")
         self.data = self.data.query("EC_qual_st == 'Yes'")
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_population(self, **kwargs) -> gpd.GeoDataFrame:
         """Updates the data with a total population count column
@@ -766,7 +928,11 @@ class FossilFuelDataset(GeoDataset):
         zip_file_path = (
             "MSA_NMSA_FEE_EC_Status_2023v2/MSA_NMSA_FEE_EC_Status_SHP_2023v2"
         )
-        ffe_gdf = self.reader.read_shapefile(fossil_fuel_fpath, zip_file_path)
+        ffe_gdf = self.reader.read_shapefile(
+            fossil_fuel_fpath,
+            zip_file_path,
+            columns=["MSA_area_n", "fipstate_2", "fipscty_20"],
+        )
 
         # Merge population counts with fossil fuel employment counties on FIPS code
         ffe_gdf = self.population_service.centroids_fips_join(
@@ -776,17 +942,17 @@ class FossilFuelDataset(GeoDataset):
         )
 
         # Group counties by MSA/non-MSA identifier and aggregate population counts
-        msa_nonmsa_gdf = (
-            ffe_gdf.loc[:, ["MSA_area_n", "population", "population_strategy"]]
-            .groupby(by="MSA_area_n")
-            .sum()
-            .reset_index()
-        )
+        msa_nonmsa_pops = ffe_gdf.groupby(by="MSA_area_n", sort=False)[
+            "population"
+        ].sum()
 
         # Merge MSA/non-MSA population counts with larger GeoDataFrame
-        self.data = self.data.merge(msa_nonmsa_gdf, how="left", on="MSA_area_n")
+        self.data = self.data.merge(
+            msa_nonmsa_pops, how="left", left_on="MSA_area_n", right_index=True
+        )
+        self.data["population_strategy"] = Geography.PopulationCalculation.FIPS
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
 
 class Justice40Dataset(GeoDataset):
@@ -816,7 +982,9 @@ class Justice40Dataset(GeoDataset):
             ) from None
 
         # Load dataset
-        self.data = self.reader.read_shapefile(justice40_fpath)
+        self.data = self.reader.read_shapefile(
+            justice40_fpath, columns=["GEOID10", "SF", "CF", "SN_C"]
+        )
 
         # Replace NaN values
         self.data = self.data.replace({np.nan: None})
@@ -824,7 +992,7 @@ class Justice40Dataset(GeoDataset):
         # Restore CRS (lost after previous operation)
         self.data = self.data.set_crs(self.epsg)
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_name(self) -> gpd.GeoDataFrame:
         """Updates the data with a formatted name column.
@@ -838,34 +1006,24 @@ class Justice40Dataset(GeoDataset):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot construct name.")
 
-        def parse_row(row: pd.Series) -> str:
-            """Builds a geography name using other fields.
-
-            Args:
-                row (`pd.Series`): The DataFrame row.
-
-            Returns:
-                (`str`): The name.
-            """
-            # Format tract id
-            tract_id = row["GEOID10"]
-            tract_num = tract_id[-6:-2].lstrip("0")
-            block_grp = tract_id[-2:]
-            fmd_tract = tract_num if block_grp == "00" else f"{tract_num}.{block_grp}"
-            tract = f"CENSUS TRACT {fmd_tract}, "
-
-            # Format county
-            county = f"{row['CF'].upper()}, " if row["CF"] else ""
+        # Format tract ids
+        tract_nums = self.data["GEOID10"].str[-6:-2].str.lstrip("0")
+        block_grps = self.data["GEOID10"].str[-2:]
+        tracts = tract_nums.where(block_grps == "00", tract_nums + "." + block_grps)
 
-            # Format state
-            state = f"{row['SF'].upper()}"
+        # Format counties
+        counties = self.data["CF"].fillna("").str.upper()
+        counties = counties.mask(counties != "", counties + ", ")
 
-            # Compose name
-            return f"JUSTICE40 {tract}{county}{state}"
+        # Format states
+        states = self.data["SF"].str.upper()
 
-        self.data["name"] = self.data.apply(parse_row, axis=1)
+        # Compose names
+        self.data["name"] = (
+            "JUSTICE40 CENSUS TRACT " + tracts + ", " + counties + states
+        )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_fips(self) -> gpd.GeoDataFrame:
         """Updates the data with one or more columns storing
@@ -881,7 +1039,7 @@ class Justice40Dataset(GeoDataset):
             raise RuntimeError("Dataset is empty. Cannot construct FIPS Codes.")
         self.data["fips"] = self.data["GEOID10"]
         self.data["fips_pattern"] = Geography.FipsPattern.STATE_COUNTY_TRACT
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _filter_records(self) -> gpd.GeoDataFrame:
         """Filters the dataset to contain only relevant entries.
@@ -897,10 +1055,10 @@ class Justice40Dataset(GeoDataset):
         """
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot filter records.")
-        has_geom = ~self.data.geometry.isna()
+        has_geom = self.data.geometry.notna()
         is_disadv = self.data.SN_C == 1
         self.data = self.data[has_geom & is_disadv]
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_population(self, **kwargs) -> gpd.GeoDataFrame:
         """Updates the data with a total population count column
@@ -922,7 +1080,7 @@ class Justice40Dataset(GeoDataset):
             id_col="GEOID10",
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
 
 class LowIncomeDataset(GeoDataset):
@@ -959,12 +1117,18 @@ class LowIncomeDataset(GeoDataset):
 
         # Load state metadata
         state_fips = self.reader.read_csv(
-            file_name=state_fips_fpath, delimiter="|", dtype=str
+            file_name=state_fips_fpath,
+            delimiter="|",
+            usecols=["STATE", "STATE_NAME"],
+            dtype=str,
         )
 
         # Load county metadata
         county_fips = self.reader.read_csv(
-            file_name=county_fips_fpath, delimiter="|", dtype=str
+            file_name=county_fips_fpath,
+            delimiter="|",
+            usecols=["STATEFP", "COUNTYFP", "COUNTYNAME"],
+            dtype=str,
         )
 
         # Load NMTC poverty indicators for census tracts within U.S. states
@@ -998,38 +1162,34 @@ class LowIncomeDataset(GeoDataset):
         ids = nmtc_pov[nmtc_id_col].tolist() + nmtc_state_mig[nmtc_id_col].tolist()
         lic_ids = sorted(list(set(ids)))
 
-        # Build GeoDataFrame of low-income census tracts
-        gdf = None
-
-        for pth in self.reader.list_directory_contents(tracts_2020_fpath):
-            # Load tracts for state/state-equivalent
-            tract_gdf = self.reader.read_shapefile(pth)
-
-            # Filter to include only relevant tracts
-            tract_gdf = tract_gdf.query("GEOID in @lic_ids")
+        # Load census tracts for all states/state-equivalents at once
+        tract_gdf = self.reader.read_shapefiles(
+            tracts_2020_fpath,
+            columns=["GEOID", "STATEFP", "COUNTYFP", "TRACTCE", "NAMELSAD"],
+        )
 
-            # Add county name metadata
-            tract_gdf = tract_gdf.merge(
-                how="left",
-                right=county_fips[["STATEFP", "COUNTYFP", "COUNTYNAME"]],
-                on=["STATEFP", "COUNTYFP"],
-            )
+        # Filter to include only relevant tracts
+        tract_gdf = tract_gdf[tract_gdf["GEOID"].isin(lic_ids)]
 
-            # Add state name metadata
-            tract_gdf = tract_gdf.merge(
-                how="left",
-                right=state_fips[["STATE", "STATE_NAME"]],
-                left_on="STATEFP",
-                right_on="STATE",
-            )
+        # Add county name metadata
+        gdf = tract_gdf.merge(
+            how="left",
+            right=county_fips,
+            on=["STATEFP", "COUNTYFP"],
+        )
 
-            # Concatenate tracts to larger GeoDataFrame
-            gdf = tract_gdf if gdf is None else pd.concat([gdf, tract_gdf])
+        # Add state name metadata
+        gdf = gdf.merge(
+            how="left",
+            right=state_fips,
+            left_on="STATEFP",
+            right_on="STATE",
+        )
 
         # Store reference
         self.data = gdf
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_name(self) -> gpd.GeoDataFrame:
         """Updates the data with a formatted name column.
@@ -1051,7 +1211,7 @@ class LowIncomeDataset(GeoDataset):
             + self.data["STATE_NAME"].str.upper()
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_fips(self) -> gpd.GeoDataFrame:
         """Updates the data with one or more columns storing
@@ -1067,7 +1227,7 @@ class LowIncomeDataset(GeoDataset):
             raise RuntimeError("Dataset is empty. Cannot construct FIPS Codes.")
         self.data["fips"] = self.data["GEOID"]
         self.data["fips_pattern"] = Geography.FipsPattern.STATE_COUNTY_TRACT
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_population(self, **kwargs) -> gpd.GeoDataFrame:
         """Updates the data with a total population count column
@@ -1091,7 +1251,7 @@ class LowIncomeDataset(GeoDataset):
             tract_col="TRACTCE",
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
 
 class MunicipalUtilityDataset(GeoDataset):
@@ -1122,7 +1282,9 @@ class MunicipalUtilityDataset(GeoDataset):
             ) from None
 
         # Load utilities shapefile
-        self.data = self.reader.read_shapefile(utilities_fpath)
+        self.data = self.reader.read_shapefile(
+            utilities_fpath, columns=["OBJECTID", "NAME", "TYPE", "STATE"]
+        )
 
         # Load corrected names
         corrected_names = self.reader.read_csv(
@@ -1142,7 +1304,7 @@ class MunicipalUtilityDataset(GeoDataset):
         ).index.values[0]
         self.data.at[bad_data_idx, "geometry"] = hinton.iloc[0]["geometry"]
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_name(self) -> gpd.GeoDataFrame:
         """Updates the data with a formatted name column.
@@ -1155,13 +1317,12 @@ class MunicipalUtilityDataset(GeoDataset):
         """
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot construct names.")
+        states = self.data["STATE"]
+        state_names = {s: STATE_ABBREVIATIONS[s].upper() for s in states.unique()}
         self.data["name"] = (
-            self.data["NAME_CC"]
-            + ", "
-            + self.data["STATE"].apply(lambda s: STATE_ABBREVIATIONS[s])
+            self.data["NAME_CC"].str.upper() + ", " + states.map(state_names)
         )
-        self.data["name"] = self.data["name"].str.upper()
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_fips(self) -> gpd.GeoDataFrame:
         """Updates the data with one or more columns storing
@@ -1176,7 +1337,7 @@ class MunicipalUtilityDataset(GeoDataset):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot construct FIPS Codes.")
         self.data["fips"] = self.data["fips_pattern"] = None
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _filter_records(self) -> gpd.GeoDataFrame:
         """Filters the dataset to contain only relevant entries
@@ -1196,7 +1357,7 @@ class MunicipalUtilityDataset(GeoDataset):
         self.data = self.data.query(
             "TYPE in @municipal_types & " "STATE not in @excluded_states"
         )
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_population(self, **kwargs) -> gpd.GeoDataFrame:
         """Updates the data with a total population count column
@@ -1218,7 +1379,7 @@ class MunicipalUtilityDataset(GeoDataset):
             id_col="OBJECTID",
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
 
 class MunicipalityWithinStateDataset(GeoDataset):
@@ -1276,8 +1437,9 @@ class MunicipalityWithinStateDataset(GeoDataset):
 
         # Correct place FIPS codes to match codes in 2020 Census
         fips_map = corrections["census_id_gid"]["to_corrected_fips"]
-        correct_func = lambda r: fips_map.get(r["CENSUS_ID_GIDID"], r["FIPS_PLACE"])
-        gov_units["FIPS_PLACE"] = gov_units.apply(correct_func, axis=1)
+        gov_units["FIPS_PLACE"] = (
+            gov_units["CENSUS_ID_GIDID"].map(fips_map).fillna(gov_units["FIPS_PLACE"])
+        )
 
         # Consolidate FIPS columns to create GEOIDs for places and county subdivisions
         gov_units["FIPS_PLACE"] = gov_units["FIPS_PLACE"].replace({np.nan: ""})
@@ -1287,10 +1449,9 @@ class MunicipalityWithinStateDataset(GeoDataset):
         )
 
         # Load place files
-        places = None
-        for pth in self.reader.list_directory_contents(places_fpath):
-            loaded_gdf = self.reader.read_shapefile(pth)
-            places = loaded_gdf if places is None else pd.concat([places, loaded_gdf])
+        places = self.reader.read_shapefiles(
+            places_fpath, columns=["GEOID", "NAME", "NAMELSAD"]
+        )
 
         # Merge units and places
         gov_places = gov_units.merge(
@@ -1298,14 +1459,9 @@ class MunicipalityWithinStateDataset(GeoDataset):
         )
 
         # Load county subdivision files
-        county_subs = None
-        for pth in self.reader.list_directory_contents(county_subs_fpath):
-            loaded_gdf = self.reader.read_shapefile(pth)
-            county_subs = (
-                loaded_gdf
-                if county_subs is None
-                else pd.concat([county_subs, loaded_gdf])
-            )
+        county_subs = self.reader.read_shapefiles(
+            county_subs_fpath, columns=["GEOID", "NAME", "NAMELSAD"]
+        )
 
         # Merge units and county subdivisions
         gov_county_subs = gov_units.merge(
@@ -1334,17 +1490,23 @@ class MunicipalityWithinStateDataset(GeoDataset):
 
         # Load state metadata
         state_fips = self.reader.read_csv(
-            file_name=state_fips_fpath, delimiter="|", dtype=str
+            file_name=state_fips_fpath,
+            delimiter="|",
+            usecols=["STATE", "STATE_NAME"],
+            dtype=str,
         )
 
         # Load county metadata
         county_fips = self.reader.read_csv(
-            file_name=county_fips_fpath, delimiter="|", dtype=str
+            file_name=county_fips_fpath,
+            delimiter="|",
+            usecols=["STATEFP", "COUNTYFP", "COUNTYNAME"],
+            dtype=str,
         )
 
         # Merge GeoDataFrame with state names
         gdf = gdf.merge(
-            right=state_fips[["STATE_NAME", "STATE"]],
+            right=state_fips,
             how="left",
             left_on="FIPS_STATE",
             right_on="STATE",
@@ -1352,7 +1514,7 @@ class MunicipalityWithinStateDataset(GeoDataset):
 
         # Merge GeoDataFrame with county names
         gdf = gdf.merge(
-            right=county_fips[["STATEFP", "COUNTYFP", "COUNTYNAME"]],
+            right=county_fips,
             how="left",
             left_on=["FIPS_STATE", "FIPS_COUNTY"],
             right_on=["STATEFP", "COUNTYFP"],
@@ -1370,7 +1532,7 @@ class MunicipalityWithinStateDataset(GeoDataset):
         # Store reference to GeoDataFrame
         self.data = gdf
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_name(self) -> gpd.GeoDataFrame:
         """Updates the data with a formatted name column
@@ -1387,7 +1549,15 @@ class MunicipalityWithinStateDataset(GeoDataset):
             raise RuntimeError("Dataset is empty. Cannot construct name.")
 
         # Define local function to standardize name
-        def standardize_name(row: pd.Series, is_multiple: bool):
+        def standardize_name(
+            entity: str,
+            unit_name: str,
+            legal_name: str,
+            short_name: str,
+            state_name: str,
+            county_name: str,
+            is_multiple: bool,
+        ):
             """Standardizes the municipality name. When the same
             name appears multiple times in the same state, as given
             by the `is_multiple` flag, the county name is included
@@ -1395,8 +1565,17 @@ class MunicipalityWithinStateDataset(GeoDataset):
             omitted for improved readability.
 
             Args:
-                row (`pd.Series`): The DataFrame row representing
-                    the municipality.
+                entity (`str`): The municipality's legal entity type.
+
+                unit_name (`str`): The municipality's government unit name.
+
+                legal_name (`str`): The municipality's legal name.
+
+                short_name (`str`): The municipality's short name.
+
+                state_name (`str`): The name of the municipality's state.
+
+                county_name (`str`): The name of the municipality's county.
 
                 is_multiple (`bool`): A boolean indicating whether
                     the municipality's name appears more than once
@@ -1405,13 +1584,6 @@ class MunicipalityWithinStateDataset(GeoDataset):
             Returns:
                 (`str`): The corrected name.
             """
-            entity = row["entity"]
-            unit_name = row["UNIT_NAME"]
-            legal_name = row["NAMELSAD"]
-            short_name = row["NAME"]
-            state_name = row["STATE_NAME"]
-            county_name = row["COUNTYNAME"]
-
             if entity == "township" or entity.isdigit():
                 return f"{legal_name}, {county_name}, {state_name}".upper()
             elif is_multiple:
@@ -1420,24 +1592,32 @@ class MunicipalityWithinStateDataset(GeoDataset):
                 return f"{short_name}, {state_name}".upper()
 
         # Add legal entity type column to dataset
-        self.data["entity"] = self.data["NAMELSAD"].apply(lambda n: n.split()[-1])
-
-        # Group municipal short names by state
-        name_grps = self.data.groupby(by=["NAME", "FIPS_STATE"])
-
-        # Apply standardization function to each unique
-        # combination of municipality name and state
-        stnd_gdf = None
-        for name in name_grps.groups.keys():
-            gdf = name_grps.get_group(name)
-            is_multiple = len(gdf) > 1
-            gdf["name"] = gdf.apply(lambda r: standardize_name(r, is_multiple), axis=1)
-            stnd_gdf = gdf if stnd_gdf is None else pd.concat([stnd_gdf, gdf])
-
-        # Update dataset with reference to DataFrame of standardized names
-        self.data = stnd_gdf
+        self.data["entity"] = self.data["NAMELSAD"].str.split().str[-1]
+
+        # Count occurrences of each municipal short name within its state
+        name_counts = self.data.groupby(by=["NAME", "FIPS_STATE"], sort=False)[
+            "NAME"
+        ].transform("size")
+
+        # Apply standardization function to each municipality
+        self.data = self.data[name_counts.notna()]
+        is_multiple = name_counts[name_counts.notna()] > 1
+        name_cols = [
+            "entity",
+            "UNIT_NAME",
+            "NAMELSAD",
+            "NAME",
+            "STATE_NAME",
+            "COUNTYNAME",
+        ]
+        self.data["name"] = [
+            standardize_name(*values, multiple)
+            for values, multiple in zip(
+                self.data[name_cols].itertuples(index=False, name=None), is_multiple
+            )
+        ]
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_fips(self) -> gpd.GeoDataFrame:
         """Updates the data with one or more columns storing
@@ -1453,22 +1633,20 @@ class MunicipalityWithinStateDataset(GeoDataset):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot construct FIPS Codes.")
 
-        # Define local function to map FIPS code and pattern based on dataset type
-        def map(row: pd.Series):
-            if row["DATASET"] == "places":
-                return row["GEOID_PLACE"], Geography.FipsPattern.STATE_PLACE
-            else:
-                return (
-                    row["GEOID_SUBDIV"],
-                    Geography.FipsPattern.STATE_COUNTY_COUNTY_SUBDIVISION,
-                )
+        # Compare dataset types once for all rows
+        is_place = self.data["DATASET"] == "places"
 
-        # Apply function
-        self.data[["fips", "fips_pattern"]] = self.data.apply(
-            map, axis=1, result_type="expand"
+        # Map FIPS code and pattern based on dataset type
+        self.data["fips"] = self.data["GEOID_PLACE"].where(
+            is_place, self.data["GEOID_SUBDIV"]
+        )
+        self.data["fips_pattern"] = np.where(
+            is_place,
+            Geography.FipsPattern.STATE_PLACE,
+            Geography.FipsPattern.STATE_COUNTY_COUNTY_SUBDIVISION,
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _filter_records(self) -> gpd.GeoDataFrame:
         """Filters the dataset to contain only relevant entries.
@@ -1497,20 +1675,16 @@ class MunicipalityWithinStateDataset(GeoDataset):
             "NAME",
             "NAMELSAD",
         ]
-        grpd_df = self.data.groupby(by=grp_cols)
-
-        # Remove duplicate records
-        deduped_gdf = None
-        for name in grpd_df.groups.keys():
-            df = grpd_df.get_group(name)
-            if len(df) > 1:
-                df = df.query("DATASET == 'places'")
-            deduped_gdf = df if deduped_gdf is None else pd.concat([deduped_gdf, df])
+        grp_sizes = self.data.groupby(by=grp_cols, sort=False)["DATASET"].transform(
+            "size"
+        )
 
-        # Update dataset with reference to de-duped DataFrame
-        self.data = deduped_gdf
+        # Remove duplicate records, retaining only places
+        is_unique = grp_sizes == 1
+        is_place = self.data["DATASET"] == "places"
+        self.data = self.data[grp_sizes.notna() & (is_unique | is_place)]
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_population(self, **kwargs) -> gpd.GeoDataFrame:
         """Updates the data with a population column. Populations
@@ -1534,7 +1708,7 @@ class MunicipalityWithinStateDataset(GeoDataset):
             cousub_col="GEOID_SUBDIV",
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
 
 class MunicipalityWithinTerritoryDataset(GeoDataset):
@@ -1575,34 +1749,35 @@ class MunicipalityWithinTerritoryDataset(GeoDataset):
             ) from None
 
         # Load county subdivision files
-        county_subs = None
-        for pth in self.reader.list_directory_contents(county_subs_fpath):
-            loaded_gdf = self.reader.read_shapefile(pth)
-            county_subs = (
-                loaded_gdf
-                if county_subs is None
-                else pd.concat([county_subs, loaded_gdf])
-            )
+        county_subs = self.reader.read_shapefiles(
+            county_subs_fpath,
+            columns=["NAME", "GEOID", "STATEFP", "COUNTYFP", "COUSUBFP"],
+        )
 
         # Load place files
-        places = None
-        for pth in self.reader.list_directory_contents(places_fpath):
-            loaded_gdf = self.reader.read_shapefile(pth)
-            places = loaded_gdf if places is None else pd.concat([places, loaded_gdf])
+        places = self.reader.read_shapefiles(
+            places_fpath, columns=["NAME", "GEOID", "STATEFP"]
+        )
 
         # Load state metadata
         state_fips = self.reader.read_csv(
-            file_name=state_fips_fpath, delimiter="|", dtype=str
+            file_name=state_fips_fpath,
+            delimiter="|",
+            usecols=["STATE", "STATE_NAME"],
+            dtype=str,
         )
 
         # Load county metadata
         county_fips = self.reader.read_csv(
-            file_name=county_fips_fpath, delimiter="|", dtype=str
+            file_name=county_fips_fpath,
+            delimiter="|",
+            usecols=["STATEFP", "COUNTYFP", "COUNTYNAME"],
+            dtype=str,
         )
 
         # Merge county subdivisions with county metadata
         county_subs = county_subs.merge(
-            right=county_fips[["STATEFP", "COUNTYFP", "COUNTYNAME"]],
+            right=county_fips,
             how="left",
             on=["STATEFP", "COUNTYFP"],
         )
@@ -1626,7 +1801,7 @@ class MunicipalityWithinTerritoryDataset(GeoDataset):
 
         # Merge resulting dataset with state metadata
         gdf = gdf.merge(
-            right=state_fips[["STATE_NAME", "STATE"]],
+            right=state_fips,
             how="left",
             left_on="STATEFP",
             right_on="STATE",
@@ -1635,7 +1810,7 @@ class MunicipalityWithinTerritoryDataset(GeoDataset):
         # Store reference to DataFrame
         self.data = gdf
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_name(self) -> gpd.GeoDataFrame:
         """Updates the data with a formatted name column.
@@ -1655,7 +1830,7 @@ class MunicipalityWithinTerritoryDataset(GeoDataset):
             self.data["NAME"].str.upper() + ", " + self.data["STATE_NAME"].str.upper()
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_fips(self) -> gpd.GeoDataFrame:
         """Updates the data with one or more columns storing
@@ -1674,17 +1849,14 @@ class MunicipalityWithinTerritoryDataset(GeoDataset):
         # Set FIPS column
         self.data["fips"] = self.data["GEOID"]
 
-        # Define local function to map FIPS code pattern based on dataset type
-        map_func = lambda r: (
-            Geography.FipsPattern.STATE_PLACE
-            if r["DATASET"] == "places"
-            else Geography.FipsPattern.STATE_COUNTY_COUNTY_SUBDIVISION
+        # Map FIPS code pattern based on dataset type
+        self.data["fips_pattern"] = np.where(
+            self.data["DATASET"] == "places",
+            Geography.FipsPattern.STATE_PLACE,
+            Geography.FipsPattern.STATE_COUNTY_COUNTY_SUBDIVISION,
         )
 
-        # Apply function
-        self.data["fips_pattern"] = self.data.apply(map_func, axis=1)
-
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _filter_records(self) -> gpd.GeoDataFrame:
         """Filters the dataset to contain only relevant entries
@@ -1715,7 +1887,7 @@ class MunicipalityWithinTerritoryDataset(GeoDataset):
         # Apply filters
         self.data = self.data[(valid_place) | (valid_county_sub)]
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_population(self, **kwargs) -> gpd.GeoDataFrame:
         """Updates the data with a population column. Populations
@@ -1739,7 +1911,7 @@ class MunicipalityWithinTerritoryDataset(GeoDataset):
             cousub_col="GEOID",
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
 
 class RuralCoopDataset(GeoDataset):
@@ -1771,8 +1943,10 @@ class RuralCoopDataset(GeoDataset):
             ) from None
 
         # Load data
-        self.data = self.reader.read_shapefile(utilities_fpath)
-        return self.data.copy()
+        self.data = self.reader.read_shapefile(
+            utilities_fpath, columns=["OBJECTID", "NAME", "TYPE", "STATE"]
+        )
+        return self.data.copy(deep=False)
 
     def _build_name(self) -> gpd.GeoDataFrame:
         """Updates the data with a formatted name column.
@@ -1785,13 +1959,12 @@ class RuralCoopDataset(GeoDataset):
         """
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot construct names.")
-        map_state = lambda s: STATE_ABBREVIATIONS[s]
+        states = self.data["STATE"]
+        state_names = {s: STATE_ABBREVIATIONS[s].upper() for s in states.unique()}
         self.data["name"] = (
-            self.data["NAME"].str.upper()
-            + ", "
-            + self.data["STATE"].apply(map_state).str.upper()
+            self.data["NAME"].str.upper() + ", " + states.map(state_names)
         )
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_fips(self) -> gpd.GeoDataFrame:
         """Updates the data with one or more columns storing
@@ -1806,7 +1979,7 @@ class RuralCoopDataset(GeoDataset):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot construct FIPS Codes.")
         self.data["fips"] = self.data["fips_pattern"] = None
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _filter_records(self) -> gpd.GeoDataFrame:
         """Filters the dataset to contain only relevant entries
@@ -1821,7 +1994,7 @@ class RuralCoopDataset(GeoDataset):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot filter records.")
         self.data = self.data.query("TYPE == 'COOPERATIVE'")
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_population(self, **kwargs) -> gpd.GeoDataFrame:
         """Updates the data with a total population count column
@@ -1843,7 +2016,7 @@ class RuralCoopDataset(GeoDataset):
             id_col="OBJECTID",
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
 
 class StateDataset(GeoDataset):
@@ -1878,7 +2051,7 @@ class StateDataset(GeoDataset):
             raise RuntimeError(f"Failed to load file. {e}") from None
 
         # Return a copy of the data for auditing purposes
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_name(self) -> gpd.GeoDataFrame:
         """Updates the data with a formatted name column.
@@ -1892,7 +2065,7 @@ class StateDataset(GeoDataset):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot construct name.")
         self.data["name"] = self.data["NAME"].str.upper()
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_fips(self) -> gpd.GeoDataFrame:
         """Updates the data with one or more columns storing
@@ -1908,7 +2081,7 @@ class StateDataset(GeoDataset):
             raise RuntimeError("Dataset is empty. Cannot construct FIPS Codes.")
         self.data["fips"] = self.data["STATEFP"]
         self.data["fips_pattern"] = Geography.FipsPattern.STATE
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
     def _build_population(self, **kwargs) -> gpd.GeoDataFrame:
         """Updates the data with a total population count column
@@ -1930,7 +2103,7 @@ class StateDataset(GeoDataset):
             state_col="STATEFP",
         )
 
-        return self.data.copy()
+        return self.data.copy(deep=False)
 
 
 class DatasetFactory:
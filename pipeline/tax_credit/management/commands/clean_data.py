@@ -1,15 +1,89 @@
 """Cleans raw datasets.
 """
 
+# Standard library imports
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, List, Tuple
+
 # Third-party imports
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandParser
 
 # Application imports
 from common.logger import LoggerFactory
-from common.storage import DataLoader, DataWriter
+from common.storage import DataLoader, DataWriter, FileSystemHelperFactory
 from tax_credit.datasets import DatasetFactory, GeoDataset
-from tax_credit.population import PopulationService
+from tax_credit.population import PopulationServiceFactory
+
+_jobs: List[Tuple[GeoDataset, Dict[str, str]]] = []
+"""The datasets to clean and their input file paths. Populated
+by the parent process and inherited by worker processes on fork.
+"""
+
+
+def _init_worker() -> None:
+    """Initializes a worker process after it is forked from the parent.
+    Discards the inherited file system helper, whose cloud storage
+    client and pooled connections belong to the parent, and then
+    gives each queued dataset new clients built on a fresh helper.
+
+    Args:
+        `None`
+
+    Returns:
+        `None`
+    """
+    FileSystemHelperFactory.reset()
+    reader = DataLoader()
+    writer = DataWriter()
+    for dataset, _ in _jobs:
+        dataset.reader = reader
+        dataset.writer = writer
+
+
+def _clean_dataset(job_idx: int) -> str:
+    """Loads and cleans a dataset and then writes it to
+    geoparquet and line-delimited GeoJSON files. Executed
+    within a worker process. The two output files are
+    independent and are therefore written in parallel threads.
+    Once both are written, the key of the inputs and code from
+    which they were built is recorded alongside them.
+
+    Args:
+        job_idx (`int`): The index of the job to run.
+
+    Returns:
+        (`str`): The name of the dataset.
+    """
+    # Fetch dataset and its input files
+    dataset, fpaths = _jobs[job_idx]
+
+    # Identify inputs and code before reading them, so that any later
+    # change to the inputs leaves the recorded key out of date
+    key = dataset.build_key(**fpaths)
+
+    # Load and clean dataset
+    dataset.logger.info("Beginning processing job.")
+    dataset.process(**fpaths)
+
+    # Write dataset to geoparquet and line-delimited GeoJSON files concurrently
+    dataset.logger.info(
+        "Writing processed data to geoparquet and new line delimited GeoJSON files."
+    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(dataset.to_geoparquet),
+            executor.submit(dataset.to_geojson_lines),
+        ]
+        for future in futures:
+            future.result()
+
+    # Record key of inputs and code from which outputs were built
+    if key is not None:
+        dataset.write_manifest(key)
+
+    return dataset.name
 
 
 class Command(BaseCommand):
@@ -43,8 +117,11 @@ class Command(BaseCommand):
         super().__init__(*args, **kwargs)
 
     def add_arguments(self, parser: CommandParser) -> None:
-        """Provides an option, "geos", to clean only
-        select geography types. Valid choices include:
+        """Provides two options: (1) "geos", to clean only
+        select geography types, and (2) "force", to clean
+        datasets even when their output files were already
+        built from the current input files and code. Valid
+        choices for "geos" include:
 
         - counties
         - distressed communities
@@ -65,11 +142,21 @@ class Command(BaseCommand):
             `None`
         """
         parser.add_argument("--geos", nargs="+", default=[])
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help=(
+                "Cleans the selected datasets even if their output "
+                "files are up to date with their input files and code."
+            ),
+        )
 
     def handle(self, *args, **options) -> None:
         """Executes the command. If the "geos" option
         has been provided, only the listed datasets
         are cleaned. Otherwise, all datasets are cleaned.
+        Datasets are independent of one another and are
+        therefore cleaned in parallel worker processes.
 
         Args:
             `None`
@@ -80,11 +167,10 @@ class Command(BaseCommand):
         # Initialize variables
         geos = options["geos"]
         num_processed = 0
+        _jobs.clear()
         reader = DataLoader()
         writer = DataWriter()
-        population_service = PopulationService.initialize(
-            reader, writer, *settings.POPULATION_SERVICE.values(), self._logger
-        )
+        population_service = PopulationServiceFactory.get(reader, writer, self._logger)
 
         # Process each configured dataset
         for dataset_config in settings.RAW_DATASETS:
@@ -102,6 +188,7 @@ class Command(BaseCommand):
                 "Received request to process dataset "
                 f"\"{dataset_config['name']}\". Initializing."
             )
+            dataset_config = dataset_config.copy()
             fpaths = dataset_config.pop("files")
             dataset: GeoDataset = DatasetFactory.create(
                 **dataset_config,
@@ -111,20 +198,60 @@ class Command(BaseCommand):
                 population_service=population_service,
             )
 
-            # Load and clean dataset
-            logger.info("Beginning processing job.")
-            dataset.process(**fpaths)
+            # Skip processing if outputs were built from current inputs
+            if not options["force"] and dataset.is_current(**fpaths):
+                logger.info(
+                    "Output files were built from the current input files "
+                    "and code. Skipping. "
+                    'Pass "--force" to clean the dataset anyway.'
+                )
+                num_processed += 1
+                continue
+
+            # Otherwise, queue dataset for processing
+            _jobs.append((dataset, fpaths))
+            num_processed += 1
 
-            # Write dataset to geoparquet file
-            logger.info("Writing processed data to geoparquet file.")
-            dataset.to_geoparquet()
+        # Clean queued datasets in parallel, forking workers so
+        # that they inherit the datasets and population service
+        if _jobs:
+            # Reproject and index population centroids once per dataset
+            # CRS, so that workers share the cached spatial indexes
+            for epsg in sorted({int(dataset.epsg) for dataset, _ in _jobs}):
+                population_service.prepare_centroids_sjoin(f"EPSG:{epsg}")
 
-            # Write dataset to line-delimited GeoJSON
-            logger.info("Writing processed data to new line delimited GeoJSON.")
-            dataset.to_geojson_lines()
+            self._logger.info(
+                f"Cleaning {len(_jobs)} dataset(s) using up to "
+                f"{settings.CLEAN_DATA_MAX_WORKERS} worker process(es)."
+            )
+            failed = []
+            with ProcessPoolExecutor(
+                max_workers=settings.CLEAN_DATA_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+            ) as executor:
+                futures = {
+                    executor.submit(_clean_dataset, job_idx): dataset.name
+                    for job_idx, (dataset, _) in enumerate(_jobs)
+                }
+                for future in as_completed(futures):
+                    # Log failures without abandoning the remaining datasets
+                    name = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self._logger.error(f'Failed to clean dataset "{name}". {e}')
+                        failed.append(name)
+                        continue
+                    self._logger.info(f'Finished cleaning dataset "{name}".')
 
-            # Update number of datasets processed
-            num_processed += 1
+            # Exit with an error if any dataset could not be cleaned
+            if failed:
+                self._logger.error(
+                    f"{len(failed)} dataset(s) could not be cleaned: "
+                    f"{', '.join(failed)}."
+                )
+                exit(1)
 
         # Log completion of job
         if not num_processed:
@@ -3,20 +3,123 @@
 
 # Standard library imports
 import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, UTC
+from typing import Optional, Tuple
 
 # Third-party imports
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections
 from django.db.utils import IntegrityError, ProgrammingError
 
 # Application imports
-from common.db import dynamic_bulk_insert
+from common.db import values_insert
 from common.logger import LoggerFactory
-from common.storage import DataLoader, DataWriter
+from common.storage import DataLoader, DataWriter, FileSystemHelperFactory
 from tax_credit.associations import AssociationsService
-from tax_credit.models import TargetBonusGeographyOverlap
-from tax_credit.population import PopulationService
+from tax_credit.models import Geography, TargetBonusGeographyOverlap
+from tax_credit.population import PopulationServiceFactory
+
+
+_assoc_service: Optional[AssociationsService] = None
+"""The service used to find target-bonus geography matches. Set
+by the parent process and inherited by worker processes on fork.
+"""
+
+
+def _init_worker() -> None:
+    """Initializes a worker process after it is forked from the parent.
+    Discards the inherited file system helper, whose cloud storage
+    client and pooled connections belong to the parent, so that any
+    file access within the worker creates its own. Database connections
+    are closed by the parent before forking and are therefore opened
+    anew by each worker on first use.
+
+    Args:
+        `None`
+
+    Returns:
+        `None`
+    """
+    FileSystemHelperFactory.reset()
+
+
+def _load_associations(geo_type_combo: Tuple[str, str]) -> int:
+    """Finds matches between a target and bonus geography type,
+    estimates the population within each overlap, and then bulk
+    inserts the associations into the database. Executed within
+    a worker process, which opens its own database connection.
+
+    Args:
+        geo_type_combo (`tuple` of `str`, `str`): The target
+            and bonus geography types, respectively.
+
+    Raises:
+        (`RuntimeError`) if the associations could not be inserted.
+
+    Returns:
+        (`int`): The number of records inserted.
+    """
+    # Create custom logger for dataset type
+    target_geo_type, bonus_geo_type = geo_type_combo
+    log_name = f"LOAD {target_geo_type.upper()} <> {bonus_geo_type.upper()}"
+    logger = LoggerFactory.get(log_name)
+
+    # Log and time start of processing
+    logger.info(
+        "Calculating intersections between geography types "
+        f'"{target_geo_type}" (target) and "{bonus_geo_type}" (bonus).'
+    )
+    start_time = datetime.now(UTC)
+
+    # Find bonus type geography matches
+    logger.info("Searching for bonus geography matches.")
+    matches = _assoc_service.find_bonus_matches(target_geo_type, bonus_geo_type)
+    logger.info(f"{len(matches)} match(es) found.")
+    if not matches:
+        return 0
+
+    # Perform bulk insert of matches into database
+    try:
+        logger.info(
+            f"Inserting {len(matches)} target-bonus "
+            "association(s) into database in batches."
+        )
+        num_inserted = values_insert(
+            matches,
+            TargetBonusGeographyOverlap.objects,
+            ["target_id", "bonus_id", "population", "population_strategy"],
+            logger,
+        )
+        elapsed = datetime.now(UTC) - start_time
+        logger.info(
+            f"{num_inserted:,} record(s) successfully "
+            "inserted (or ignored if already present) "
+            f"in {elapsed}."
+        )
+    except (IntegrityError, ValueError, ProgrammingError) as e:
+        raise RuntimeError(
+            f'Failed to insert "{target_geo_type}" <> '
+            f'"{bonus_geo_type}" associations. {e}'
+        ) from None
+
+    # Log completion
+    logger.info(
+        f'Finished matching "{target_geo_type}" geographies '
+        f'with "{bonus_geo_type}" geographies and loading into '
+        f"database in {elapsed}."
+    )
+
+    # Log warning if matching and load time exceeded configured threshold
+    if elapsed > timedelta(minutes=settings.SLOW_LOAD_THRESHOLD_IN_MINUTES):
+        logger.warn(
+            "Matching and load time exceeded the threshold "
+            f"of {settings.SLOW_LOAD_THRESHOLD_IN_MINUTES}."
+        )
+
+    return num_inserted
 
 
 class Command(BaseCommand):
@@ -122,7 +225,10 @@ class Command(BaseCommand):
         """Executes the command. If the "target" and/or
         "bonus" option(s), have been provided, only the
         listed geography types are processed. Otherwise,
-        all geography types are processed.
+        all geography types are processed. Combinations of
+        target and bonus geography types are independent of
+        one another and are therefore matched and loaded in
+        parallel worker processes.
 
         Args:
             `None`
@@ -131,74 +237,48 @@ class Command(BaseCommand):
             `None`
         """
         # Initialize variables
+        global _assoc_service
         reader = DataLoader()
         writer = DataWriter()
-        population_service = PopulationService.initialize(
-            reader, writer, *settings.POPULATION_SERVICE.values(), self._logger
+        population_service = PopulationServiceFactory.get(reader, writer, self._logger)
+        _assoc_service = AssociationsService(population_service)
+        geo_type_combos = list(itertools.product(options["target"], options["bonus"]))
+
+        # Reproject and index population centroids in the geography
+        # table's CRS once, so that forked workers share the result
+        srid = Geography._meta.get_field("geometry").srid
+        population_service.prepare_centroids_sjoin(f"EPSG:{srid}")
+
+        # Close open database connections so that forked
+        # workers do not share the parent's connection. Storage
+        # clients are instead recreated by the worker initializer.
+        connections.close_all()
+
+        # Match and load each combination of target and bonus geography
+        # type in parallel, forking workers so that they inherit the
+        # population service rather than reloading it
+        self._logger.info(
+            f"Loading {len(geo_type_combos)} target-bonus geography type "
+            f"combination(s) using up to {settings.LOAD_ASSOCIATIONS_MAX_WORKERS} "
+            "worker process(es)."
         )
-        assoc_service = AssociationsService(population_service)
-
-        # Iterate through each combination of target and bonus geography type
-        for geo_type_combo in itertools.product(options["target"], options["bonus"]):
-
-            # Create custom logger for dataset type
-            target_geo_type, bonus_geo_type = geo_type_combo
-            log_name = f"LOAD {target_geo_type.upper()} <> {bonus_geo_type.upper()}"
-            logger = LoggerFactory.get(log_name)
-
-            # Log and time start of processing
-            logger.info(
-                "Calculating intersections between geography types "
-                f'"{target_geo_type}" (target) and "{bonus_geo_type}" (bonus).'
-            )
-            start_time = datetime.now(UTC)
-
-            # Find bonus type geography matches
-            logger.info("Searching for bonus geography matches.")
-            matches = assoc_service.find_bonus_matches(target_geo_type, bonus_geo_type)
-            logger.info(f"{len(matches)} match(es) found.")
-            if not matches:
-                continue
-
-            # Define generator to construct table records
-            target_bonus_geos = (
-                TargetBonusGeographyOverlap(None, *match) for match in matches
-            )
-
-            # Perform bulk insert of matches into database
-            try:
-                logger.info(
-                    f"Inserting {len(matches)} target-bonus "
-                    "association(s) into database in batches."
-                )
-                num_inserted = dynamic_bulk_insert(
-                    target_bonus_geos,
-                    TargetBonusGeographyOverlap.objects,
-                    logger,
-                )
-                elapsed = datetime.now(UTC) - start_time
-                logger.info(
-                    f"{num_inserted:,} record(s) successfully "
-                    "inserted (or ignored if already present) "
-                    f"in {elapsed}."
-                )
-            except (IntegrityError, ValueError, ProgrammingError) as e:
-                logger.error(f"Failed to insert associations. {e}")
-                exit(1)
-
-            # Log completion
-            logger.info(
-                f'Finished matching "{target_geo_type}" geographies '
-                f'with "{bonus_geo_type}" geographies and loading into '
-                f"database in {elapsed}."
-            )
-
-            # Log warning if matching and load time exceeded configured threshold
-            if elapsed > timedelta(minutes=settings.SLOW_LOAD_THRESHOLD_IN_MINUTES):
-                logger.warn(
-                    "Matching and load time exceeded the threshold "
-                    f"of {settings.SLOW_LOAD_THRESHOLD_IN_MINUTES}."
-                )
+        try:
+            with ProcessPoolExecutor(
+                max_workers=settings.LOAD_ASSOCIATIONS_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+            ) as executor:
+                for combo, num_inserted in zip(
+                    geo_type_combos,
+                    executor.map(_load_associations, geo_type_combos),
+                ):
+                    self._logger.info(
+                        f'Loaded {num_inserted:,} "{combo[0]}" <> '
+                        f'"{combo[1]}" association(s).'
+                    )
+        except RuntimeError as e:
+            self._logger.error(f"Association load failed. {e}")
+            exit(1)
 
         # Mark end of process
         self._logger.info(
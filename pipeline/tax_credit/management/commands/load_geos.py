@@ -7,22 +7,21 @@ import random
 # Third-party imports
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandParser
-from django.db.utils import IntegrityError, ProgrammingError
+from django.db.utils import DataError, IntegrityError, ProgrammingError
 
 # Application imports
-from common.db import dynamic_bulk_insert
+from common.db import copy_insert
 from common.logger import LoggerFactory
-from common.storage import ParquetDataReader
+from common.storage import DataLoader
 from tax_credit.models import Geography
 
 
 class Command(BaseCommand):
     """Loads cleaned geo datasets from the configured storage location,
-    validates the data, applies transformation functions to the
-    records of each dataset in preparation for database table load,
-    and then upserts the records to the geography table in batches
-    using an exponential smoothing algorithm to dynamically determine
-    the batch size.
+    validates the data, applies vectorized transformation functions
+    to the records of each dataset in preparation for database table
+    load, and then upserts the records to the geography table in
+    chunks using PostgreSQL's `COPY` protocol.
 
     References:
     - https://docs.djangoproject.com/en/4.1/howto/custom-management-commands/
@@ -105,7 +104,7 @@ class Command(BaseCommand):
         """
         # Initialize variables
         num_processed = 0
-        reader = ParquetDataReader()
+        reader = DataLoader()
         geos = options["geos"]
         try:
             dataset_max_size, random_seed = options["smoke_test"]
@@ -133,7 +132,7 @@ class Command(BaseCommand):
             log_name = f"LOAD {dataset_name.upper()}"
             self._logger = LoggerFactory.get(log_name)
 
-            # Attempt to load dataset and map each row to geography type
+            # Attempt to load dataset
             self._logger.info(
                 "Received request to load cleaned dataset "
                 f"\"{dataset_config['name']}\" into the "
@@ -141,47 +140,42 @@ class Command(BaseCommand):
                 "mapping dataset rows to database table schema."
             )
             try:
-                mapped_geos = (
-                    Geography.from_series(row)
-                    for row in reader.iterate(dataset_config["file"])
-                )
-            except FileExistsError:
+                data = reader.read_parquet(dataset_fpath)
+            except FileNotFoundError:
                 self._logger.error(
                     f'Failed to load dataset "{dataset_name}". '
                     f'Could not find file "{dataset_fpath}".'
                 )
                 exit(1)
-            except RuntimeError as e:
-                self._logger.error(f'Failed to load dataset "{dataset_name}". {e}')
-                exit(1)
 
             # If conducting smoke test, take random sample of geographies
             if options["smoke_test"]:
-                self._logger.info(
-                    "Taking random sample of mapped geographies for smoke test."
-                )
+                self._logger.info("Taking random sample of geographies for smoke test.")
                 random.seed(random_seed)
-                num_geos = sum(1 for _ in reader.iterate(dataset_config["file"]))
+                num_geos = len(data)
                 geo_indices = list(range(num_geos))
                 sample_size = min(num_geos, dataset_max_size)
                 sample_indices = random.sample(geo_indices, sample_size)
-                mapped_geos = (
-                    geo for idx, geo in enumerate(mapped_geos) if idx in sample_indices
-                )
+                data = data.iloc[sorted(sample_indices)]
 
-            # Bulk insert mapped geographies to table in batches
+            # Map each row to geography table schema
+            try:
+                mapped_geos = Geography.to_table_rows(data)
+            except RuntimeError as e:
+                self._logger.error(f'Failed to load dataset "{dataset_name}". {e}')
+                exit(1)
+
+            # Bulk insert mapped geographies to table in chunks
             try:
                 self._logger.info(
                     f'Inserting "{dataset_name}" into Geography database table.'
                 )
-                num_inserted = dynamic_bulk_insert(
-                    mapped_geos, Geography.objects, self._logger
-                )
+                num_inserted = copy_insert(mapped_geos, Geography.objects, self._logger)
                 self._logger.info(
                     f"{num_inserted:,} record(s) successfully "
                     "inserted (or ignored if already present)."
                 )
-            except (IntegrityError, ValueError, ProgrammingError) as e:
+            except (DataError, IntegrityError, ValueError, ProgrammingError) as e:
                 self._logger.error(
                     f'Failed to insert geographies for dataset "{dataset_name}". {e}'
                 )
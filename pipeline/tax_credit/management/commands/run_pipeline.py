@@ -0,0 +1,114 @@
+"""Runs one or more stages of the data pipeline within a single process.
+"""
+
+# Third-party imports
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandParser
+
+# Application imports
+from common.logger import LoggerFactory
+
+
+class Command(BaseCommand):
+    """Executes the selected data pipeline stages (i.e., cleaning raw
+    datasets, loading geographies, loading target-bonus associations,
+    replicating the database, and syncing Mapbox tilesets) in order
+    within the current Python interpreter. Running the stages in-process
+    avoids paying the cost of interpreter startup and third-party
+    library imports (e.g., GeoPandas, Shapely, and PyArrow) once per
+    stage, as happens when each stage is invoked through `manage.py`.
+    Settings are likewise resolved once, and the population service
+    loaded by the data cleaning stage is reused when computing
+    associations.
+
+    References:
+    - https://docs.djangoproject.com/en/4.1/howto/custom-management-commands/
+    - https://docs.djangoproject.com/en/4.1/ref/django-admin/#running-management-commands-from-your-code
+    """
+
+    help = "Runs the selected data pipeline stages in a single process."
+    name = "Run Pipeline"
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initializes a new instance of the `Command`.
+
+        Args:
+            *The default positional arguments for the base class.
+
+        Kwargs:
+            **The default keyword arguments for the base class.
+
+        Returns:
+            `None`
+        """
+        self._logger = LoggerFactory.get(Command.name.upper())
+        super().__init__(*args, **kwargs)
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Provides one flag per pipeline stage. Stages
+        are always executed in the order listed below,
+        regardless of the order in which flags are given:
+
+        - clean-data
+        - load-geos
+        - load-associations
+        - replicate-database
+        - sync-mapbox
+
+        Args:
+            parser (`CommandParser`)
+
+        Returns:
+            `None`
+        """
+        parser.add_argument("--clean-data", action="store_true")
+        parser.add_argument("--load-geos", action="store_true")
+        parser.add_argument("--load-associations", action="store_true")
+        parser.add_argument("--replicate-database", action="store_true")
+        parser.add_argument("--sync-mapbox", action="store_true")
+
+    def handle(self, *args, **options) -> None:
+        """Executes the command.
+
+        Args:
+            `None`
+
+        Returns:
+            `None`
+        """
+        # Generate cleaned datasets if indicated
+        if options["clean_data"]:
+            self._logger.info("Generating geography datasets from raw data files.")
+            call_command("clean_data")
+
+        # Load cleaned geographies into database if indicated
+        if options["load_geos"]:
+            self._logger.info("Loading geographies into database.")
+            call_command("load_geos")
+
+        # Compute and load associations between target and bonus geographies
+        if options["load_associations"]:
+            self._logger.info("Loading association table into database.")
+            call_command("load_associations")
+
+        # Replicate tables in production database if indicated
+        if options["replicate_database"]:
+            self._logger.info(
+                "Applying migrations to production database used for web app."
+            )
+            call_command("migrate", database="resized", interactive=False)
+
+            self._logger.info(
+                "Replicating tables in current database to production database."
+            )
+            call_command("replicate_database")
+
+        # Update Mapbox tilesets to match cleaned geographies if indicated
+        if options["sync_mapbox"]:
+            self._logger.info(
+                "Syncing remote Mapbox tilesets with lastest cleaned geographies."
+            )
+            call_command("sync_tilesets")
+
+        # Log completion
+        self._logger.info("Pipeline stages completed successfully.")
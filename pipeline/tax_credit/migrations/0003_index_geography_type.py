@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tax_credit", "0002_install_indexed_search_fields"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="geography",
+            name="geography_type",
+            field=models.CharField(
+                choices=[
+                    ("county", "County"),
+                    ("distressed", "Distressed"),
+                    ("energy", "Energy"),
+                    ("justice40", "Justice40"),
+                    ("low-income", "Low Income"),
+                    ("municipality", "Municipality"),
+                    ("municipal utility", "Municipal Utility"),
+                    ("rural cooperative", "Rural Cooperative"),
+                    ("state", "State"),
+                ],
+                db_index=True,
+            ),
+        ),
+    ]
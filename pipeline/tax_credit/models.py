@@ -3,14 +3,36 @@
 
 # Third-party imports
 import json
+import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 from django.db.models import Case, Value, When
 from django.db.models.functions import Cast
 from django.contrib.gis.db.models import MultiPolygonField
-from django.contrib.gis.geos import GEOSGeometry, MultiPolygon
 from django.db import models
 
 
+def to_multipolygons(geometry: gpd.GeoSeries) -> gpd.GeoSeries:
+    """Converts the Polygons within a geometry column to MultiPolygons,
+    the only geometry type accepted by the geography table, using a
+    single vectorized call rather than a per-geometry loop. Geometries
+    of other types are left unchanged.
+
+    Args:
+        geometry (`gpd.GeoSeries`): The geometry column.
+
+    Returns:
+        (`gpd.GeoSeries`): The converted geometry column.
+    """
+    geoms = np.array(geometry.values, dtype=object)
+    is_polygon = shapely.get_type_id(geoms) == shapely.GeometryType.POLYGON
+    geoms[is_polygon] = shapely.multipolygons(
+        geoms[is_polygon], indices=np.arange(is_polygon.sum())
+    )
+    return gpd.GeoSeries(geoms, index=geometry.index, crs=geometry.crs)
+
+
 class Geography(models.Model):
     """Represents a geography published by a data source."""
 
@@ -73,7 +95,7 @@ class Geography(models.Model):
     name = models.CharField(max_length=255)
     fips = models.CharField(max_length=255, blank=True, default="")
     fips_pattern = models.CharField(choices=FipsPattern, blank=True, default="")
-    geography_type = models.CharField(choices=GeographyType)
+    geography_type = models.CharField(choices=GeographyType, db_index=True)
     population = models.IntegerField(null=True)
     population_strategy = models.CharField(choices=PopulationCalculation)
     as_of = models.DateField()
@@ -118,48 +140,65 @@ class Geography(models.Model):
         return f"Geography({attrs})"
 
     @staticmethod
-    def from_series(data: pd.Series) -> "Geography":
-        """Maps a row from a cleaned geography dataset
-        into a `Geography` database model object.
+    def to_table_rows(data: gpd.GeoDataFrame) -> pd.DataFrame:
+        """Maps a cleaned geography dataset into rows of
+        geography database table column values that can be
+        bulk loaded with PostgreSQL's `COPY` command. Geometries
+        are converted to MultiPolygons where necessary and then
+        serialized as hex-encoded EWKB in the geometry column's
+        SRID using vectorized operations.
 
         Args:
-            data (`pd.Series`): The row. Expected to
-                have the columns "geometry", "name",
-                "fips", "fips_pattern", "geography_type",
-                "as_of", "published_on" and "source".
+            data (`gpd.GeoDataFrame`): The dataset. Expected to
+                have the columns "geometry", "name", "fips",
+                "fips_pattern", "geography_type", "population",
+                "population_strategy", "as_of", "published_on"
+                and "source".
+
+        Raises:
+            (`RuntimeError`) if the dataset is missing an expected column.
 
         Returns:
-            (`Geography`): The object.
+            (`pd.DataFrame`): The table rows.
         """
+        # Subset dataset to table columns
+        columns = [
+            "name",
+            "fips",
+            "fips_pattern",
+            "geography_type",
+            "population",
+            "population_strategy",
+            "as_of",
+            "published_on",
+            "source",
+        ]
         try:
-            # Correct row geometry to ensure MultiPolygon type
-            geos_geom: GEOSGeometry = GEOSGeometry(memoryview(data["geometry"]))
-            safe_geometry = (
-                geos_geom
-                if geos_geom.geom_type == "MultiPolygon"
-                else MultiPolygon(geos_geom)
-            )
-
-            # Build geography
-            return Geography(
-                name=data["name"],
-                fips="" if not data["fips"] else data["fips"],
-                fips_pattern=("" if not data["fips_pattern"] else data["fips_pattern"]),
-                geography_type=data["geography_type"],
-                population=data["population"],
-                population_strategy=data["population_strategy"],
-                as_of=data["as_of"],
-                published_on=data["published_on"],
-                source=data["source"],
-                geometry=safe_geometry,
-            )
+            rows = pd.DataFrame(data[columns])
+            geometry = data["geometry"]
         except KeyError as e:
             raise RuntimeError(
-                f"Failed to create Geography database record. "
-                f'Data missing expected key "{e}". The actual '
-                f"keys are: {', '.join(data.keys())}."
+                "Failed to map dataset to Geography database records. "
+                f"Data missing expected column(s). {e}"
             ) from e
 
+        # Replace missing FIPS codes and patterns with empty strings
+        rows[["fips", "fips_pattern"]] = rows[["fips", "fips_pattern"]].fillna("")
+
+        # Store populations as nullable integers
+        rows["population"] = rows["population"].astype("Int64")
+
+        # Correct geometries to ensure MultiPolygon type
+        geoms = np.asarray(to_multipolygons(geometry).values, dtype=object)
+
+        # Serialize geometries as EWKB in geometry column's SRID
+        srid = Geography._meta.get_field("geometry").srid
+        rows["geometry"] = shapely.to_wkb(
+            shapely.set_srid(geoms, srid), hex=True, include_srid=True
+        )
+
+        return rows
+
 
 class TargetBonusGeographyOverlap(models.Model):
     """Represents an association between a target geography
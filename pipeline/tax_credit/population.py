@@ -2,13 +2,21 @@
 """
 
 # Standard library imports
+import hashlib
+import json
 import logging
-import math
-from typing import Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Third-party imports
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyproj
+import shapely
+from django.conf import settings
 
 # Application imports
 from common.storage import DataLoader, DataWriter
@@ -45,6 +53,7 @@ class PopulationService:
             `None`
         """
         self._pop_centroids = pop_centroids
+        self._centroid_indices: Dict[str, Tuple[np.ndarray, shapely.STRtree]] = {}
         self._zcta_pop_df = zcta_pop_df
         self._place_pop_df = place_pop_df
         self._cousub_pop_df = cousub_pop_df
@@ -86,119 +95,109 @@ class PopulationService:
         Returns:
             (`gpd.GeoDataFrame`): The dataset.
         """
-        # Load census blocks from shapefiles
+        # Load census block internal points from shapefiles, skipping the
+        # block boundaries, which are never used
         logger.info("Loading census blocks from shapefiles.")
-        blk_gdf = None
-        for pth in reader.list_directory_contents(shapefile_fpath):
-            gdf = reader.read_shapefile(pth, dtype=str, crs=shapefile_crs)
-            blk_gdf = gdf if blk_gdf is None else pd.concat([blk_gdf, gdf])
-
-        # Create new GeoDataFrame using census blocks' internal points as geometries
-        logger.info("Parsing census block internal points as geometries.")
-        blk_pts_gdf = gpd.GeoDataFrame(
-            data=blk_gdf[["GEOID20", "INTPTLAT20", "INTPTLON20"]],
-            geometry=gpd.points_from_xy(
-                x=blk_gdf["INTPTLON20"], y=blk_gdf["INTPTLAT20"]
-            ),
-            crs=shapefile_crs,
+        blk_df = reader.read_shapefiles(
+            shapefile_fpath,
+            columns=["GEOID20", "INTPTLAT20", "INTPTLON20"],
+            read_geometry=False,
+        )
+
+        # Parse census blocks' internal points as numeric coordinates, as
+        # only the coordinates themselves enter the mean center formula
+        logger.info("Parsing census block internal points as coordinates.")
+        blk_pts_df = pd.DataFrame(
+            {
+                "GEOID20": blk_df["GEOID20"].to_numpy(),
+                "LATITUDE": blk_df["INTPTLAT20"].to_numpy(dtype=np.float64),
+                "LONGITUDE": blk_df["INTPTLON20"].to_numpy(dtype=np.float64),
+            }
         )
 
         # Load census block group housing unit counts
         logger.info("Loading census block group housing unit counts.")
-        house_units_df = reader.read_csv(
+        house_units_df = reader.read_csv_columns(
             file_name=house_units_fpath,
-            dtype=str,
+            columns={
+                "STATEFP": pa.string(),
+                "COUNTYFP": pa.string(),
+                "TRACTCE": pa.string(),
+                "BLKGRPCE": pa.string(),
+                "BLKCE": pa.string(),
+                "HOUSING_UNITS": pa.int32(),
+            },
             delimiter="|",
         )
 
-        # Correct housing column data types
-        logger.info("Correcting column data types.")
-        house_units_df["HOUSING_UNITS"] = house_units_df["HOUSING_UNITS"].astype(int)
-
         # Add new housing geo id columns to facilitate future joins and aggregations
         logger.info("Adding new column geography identifiers.")
-        house_units_df["GEOID_BLK"] = (
+        geoid_tract = (
             house_units_df["STATEFP"]
             + house_units_df["COUNTYFP"]
             + house_units_df["TRACTCE"]
-            + house_units_df["BLKCE"]
-        )
-        house_units_df["GEOID_BLKGRP"] = (
-            house_units_df["STATEFP"]
-            + house_units_df["COUNTYFP"]
-            + house_units_df["TRACTCE"]
-            + house_units_df["BLKGRPCE"]
         )
+        house_units_df["GEOID_BLK"] = geoid_tract + house_units_df["BLKCE"]
+        house_units_df["GEOID_BLKGRP"] = geoid_tract + house_units_df["BLKGRPCE"]
 
-        # Merge census block point geometries with housing counts
+        # Merge census block points with housing counts
         logger.info("Merging census block group points with housing counts.")
-        merged_blk_pts_gdf = blk_pts_gdf[["GEOID20", "geometry"]].merge(
+        merged_blk_pts_df = blk_pts_df.merge(
             right=house_units_df, how="left", left_on="GEOID20", right_on="GEOID_BLK"
         )
 
-        # Group resulting records by block group
-        logger.info("Grouping merged points by census block group id.")
-        grouped = merged_blk_pts_gdf.groupby(by="GEOID_BLKGRP")
+        # Remove blocks without housing units from calculation
+        logger.info("Removing blocks without housing units.")
+        populated_df = merged_blk_pts_df.query("HOUSING_UNITS > 0")
 
-        # Aggregate housing unit counts at the block group level by
-        # computing the mean center of the housing units within each block group
+        # Compute weighted terms of the mean center formula for every block at once
         logger.info(
-            "Iterating through block groups to compute each group's mean center "
-            "latitude and longitude of housing from constituent blocks."
+            "Computing weighted latitudes and longitudes of housing for all blocks."
+        )
+        blk_unit_counts = populated_df["HOUSING_UNITS"].to_numpy(dtype=float)
+        longitudes = populated_df["LONGITUDE"].to_numpy()
+        latitudes = populated_df["LATITUDE"].to_numpy()
+        proj_latitudes = np.cos(latitudes)
+        weighted_df = pd.DataFrame(
+            {
+                "GEOID_BLKGRP": populated_df["GEOID_BLKGRP"].to_numpy(),
+                "STATEFP": populated_df["STATEFP"].to_numpy(),
+                "COUNTYFP": populated_df["COUNTYFP"].to_numpy(),
+                "TRACTCE": populated_df["TRACTCE"].to_numpy(),
+                "BLKGRPCE": populated_df["BLKGRPCE"].to_numpy(),
+                "UNITS": blk_unit_counts,
+                "UNITS_LAT": blk_unit_counts * latitudes,
+                "UNITS_LON_PROJ": blk_unit_counts * longitudes * proj_latitudes,
+                "UNITS_PROJ": blk_unit_counts * proj_latitudes,
+            }
+        )
+
+        # Aggregate terms by block group to compute the mean
+        # center latitude and longitude of block group housing
+        logger.info(
+            "Aggregating blocks by census block group id to compute each "
+            "group's mean center latitude and longitude of housing."
         )
-        centers = []
-        for grp_key in grouped.groups:
-
-            # Fetch blocks within block group
-            logger.info(f'Processing blocks in block group "{grp_key}".')
-            grp_gdf = grouped.get_group(grp_key)
-
-            # Remove blocks without housing units from calculation
-            populated_gdf = grp_gdf.query("HOUSING_UNITS > 0")
-            if not len(populated_gdf):
-                logger.info("No blocks in group have housing units. Skipping.")
-                continue
-
-            # Initialize variables to simplify computation of mean center
-            blk_unit_counts = populated_gdf["HOUSING_UNITS"]
-            total_units = populated_gdf["HOUSING_UNITS"].sum()
-            longitudes = populated_gdf["geometry"].x
-            latitudes = populated_gdf["geometry"].y
-            proj_latitudes = latitudes.apply(math.cos)
-
-            # Calculate mean center latitude and longitude
-            # of block group housing from blocks
-            center_lat = sum(blk_unit_counts * latitudes) / total_units
-            center_lon = sum(blk_unit_counts * longitudes * proj_latitudes) / sum(
-                blk_unit_counts * proj_latitudes
-            )
-
-            # Append new center to list
-            centers.append(
-                {
-                    "GEOID_BLKGRP": grp_key,
-                    "STATEFP": populated_gdf["STATEFP"].iloc[0],
-                    "COUNTYFP": populated_gdf["COUNTYFP"].iloc[0],
-                    "TRACTCE": populated_gdf["TRACTCE"].iloc[0],
-                    "BLKGRPCE": populated_gdf["BLKGRPCE"].iloc[0],
-                    "LATITUDE": center_lat,
-                    "LONGITUDE": center_lon,
-                }
-            )
+        grouped = weighted_df.groupby(by="GEOID_BLKGRP", sort=False)
+        sums = grouped[["UNITS", "UNITS_LAT", "UNITS_LON_PROJ", "UNITS_PROJ"]].sum()
+        centers_df = grouped[["STATEFP", "COUNTYFP", "TRACTCE", "BLKGRPCE"]].first()
+        centers_df["LATITUDE"] = sums["UNITS_LAT"] / sums["UNITS"]
+        centers_df["LONGITUDE"] = sums["UNITS_LON_PROJ"] / sums["UNITS_PROJ"]
+        centers_df = centers_df.reset_index()
 
         # Convert centers to GeoDataFrame
+        num_blk_grps = merged_blk_pts_df["GEOID_BLKGRP"].nunique()
         logger.info(
-            f"{len(centers)} center points generated after "
-            f"processing {len(grouped)} block groups. "
+            f"{len(centers_df)} center points generated after "
+            f"processing {num_blk_grps} block groups. "
             "Converting points to final GeoDataFrame."
         )
         centers_gdf = gpd.GeoDataFrame(
-            data=centers,
+            data=centers_df,
             geometry=gpd.points_from_xy(
-                x=[pt["LONGITUDE"] for pt in centers],
-                y=[pt["LATITUDE"] for pt in centers],
+                x=centers_df["LONGITUDE"].to_numpy(),
+                y=centers_df["LATITUDE"].to_numpy(),
             ),
-            dtype=str,
             crs=shapefile_crs,
         )
 
@@ -235,27 +234,28 @@ class PopulationService:
         """
         # Loading census block group shapefiles
         logger.info("Loading census block group shapefiles.")
-        blkgrp_gdf = None
-        for pth in reader.list_directory_contents(shapefile_fpath):
-            gdf = reader.read_shapefile(pth, dtype=str, crs=shapefile_crs)
-            blkgrp_gdf = gdf if blkgrp_gdf is None else pd.concat([blkgrp_gdf, gdf])
+        blkgrp_gdf = reader.read_shapefiles(shapefile_fpath, columns=["GEOID"])
+
+        # Assign configured CRS if not defined by the shapefiles
+        if blkgrp_gdf.crs is None:
+            blkgrp_gdf = blkgrp_gdf.set_crs(shapefile_crs)
 
         # Load census block group populations
         logger.info("Loading census block group population counts.")
-        blkgrp_pops_df = reader.read_csv(
-            file_name=population_fpath, dtype=str, delimiter="|"
+        blkgrp_pops_df = reader.read_csv_columns(
+            file_name=population_fpath,
+            columns={"GEOID": pa.string(), "POPULATION": pa.string()},
+            delimiter="|",
         )
 
         # Drop null population records
         logger.info(f"{len(blkgrp_pops_df)} record(s) found. Dropping nulls.")
-        blkgrp_pops_df = blkgrp_pops_df.query("POPULATION == POPULATION")
+        blkgrp_pops_df = blkgrp_pops_df[blkgrp_pops_df["POPULATION"].notna()]
         logger.info(f"{len(blkgrp_pops_df)} record(s) remain.")
 
         # Merge block group geographies with block group population counts
         logger.info("Merging block group geographies with population counts.")
-        blkgrp_pops_df["GEOID"] = blkgrp_pops_df["GEOID"].apply(
-            lambda id: id.split("US")[-1]
-        )
+        blkgrp_pops_df["GEOID"] = blkgrp_pops_df["GEOID"].str.split("US").str[-1]
         blkgrp_gdf = blkgrp_gdf.merge(
             right=blkgrp_pops_df[["GEOID", "POPULATION"]], how="left", on="GEOID"
         )
@@ -283,7 +283,8 @@ class PopulationService:
     ) -> "PopulationService":
         """Creates and initializes a new `PopulationService` instance by loading
         a dataset of census block group centers of population for the U.S. and its
-        territories into memory, or by creating the dataset if it does not exist.
+        territories into memory, or by creating the dataset if it does not exist
+        or was built from different input files, code or settings.
 
         NOTE: To estimate populations for a wide range of geographies and
         their intersections, we use centers of population defined within census
@@ -365,31 +366,60 @@ class PopulationService:
 
         # Load census zip code tabulation area population counts
         logger.info("Loading population dataset for census ZCTAs.")
-        zcta_pop_df = reader.read_csv(
-            file_name=zcta_pop_fpath, dtype=str, delimiter="|"
+        zcta_pop_df = reader.read_csv_columns(
+            file_name=zcta_pop_fpath,
+            columns={"ZCTA5CE20": pa.string(), "TOTAL_POPULATION": pa.string()},
+            delimiter="|",
         )
         logger.info(f"{len(zcta_pop_df):,} record(s) loaded.")
 
         # Load census place population counts
         logger.info("Loading population dataset for census places.")
-        place_pop_df = reader.read_csv(
-            file_name=place_pop_fpath, dtype=str, delimiter="|"
+        place_pop_df = reader.read_csv_columns(
+            file_name=place_pop_fpath,
+            columns={"GEOID_PLACE": pa.string(), "TOTAL_POPULATION": pa.string()},
+            delimiter="|",
         )
         logger.info(f"{len(place_pop_df):,} record(s) loaded.")
 
         # Load census county subdivision population counts
         logger.info("Loading population dataset for census county subdivisions.")
-        cousub_pop_df = reader.read_csv(
-            file_name=county_subdivision_pop_fpath, dtype=str, delimiter="|"
+        cousub_pop_df = reader.read_csv_columns(
+            file_name=county_subdivision_pop_fpath,
+            columns={"GEOID_SUBDIV": pa.string(), "TOTAL_POPULATION": pa.string()},
+            delimiter="|",
         )
         logger.info(f"{len(cousub_pop_df):,} record(s) loaded.")
 
-        # If population centroids dataset exists, load and then instantiate store
-        try:
-            logger.info(
-                "Attempting to load pre-existing population-weighted centroids."
+        # Determine whether cached centroids were built from the current inputs,
+        # code and settings by comparing their build key against the recorded one
+        logger.info("Checking for pre-existing population-weighted centroids.")
+        manifest_fpath = PopulationService._get_manifest_fpath(output_centroids_fpath)
+        key = PopulationService._build_centroids_key(
+            reader,
+            [
+                island_blk_housing_fpath,
+                island_blk_shapefile_fpath,
+                island_blk_grp_pop_fpath,
+                island_blk_grp_shapefile_fpath,
+                us_blk_grp_centroids_fpath,
+            ],
+        )
+        has_cache = bool(reader.get_stats(output_centroids_fpath))
+        manifest = None
+        if has_cache:
+            try:
+                manifest = reader.read_json(manifest_fpath)
+            except FileNotFoundError:
+                pass
+
+        # If so, load centroids and then instantiate store
+        if key is not None and manifest == key:
+            logger.info("Loading pre-existing population-weighted centroids.")
+            all_centroids_gdf = reader.read_parquet(
+                output_centroids_fpath,
+                columns=["STATEFP", "COUNTYFP", "TRACTCE", "POPULATION", "geometry"],
             )
-            all_centroids_gdf = reader.read_parquet(output_centroids_fpath)
             logger.info(
                 f"{len(all_centroids_gdf):,} record(s) loaded. "
                 "Instantiating new population service."
@@ -397,46 +427,49 @@ class PopulationService:
             return PopulationService(
                 all_centroids_gdf, zcta_pop_df, place_pop_df, cousub_pop_df
             )
-        except FileNotFoundError:
+        elif not has_cache:
             logger.info("No file found. Building dataset anew.")
+        else:
+            logger.info(
+                "File was not built from the current input files, code and "
+                "settings. Building dataset anew."
+            )
 
-        # Otherwise, compute block group center points for islands using housing density
-        logger.info(
-            "Initiating process to compute census block group "
-            "centers of population for the U.S. Island Areas."
-        )
-        blk_grp_centers_gdf = PopulationService._build_census_block_group_centers(
-            reader,
-            island_blk_housing_fpath,
-            island_blk_shapefile_fpath,
-            island_blk_shapefile_crs,
-            logger,
-        )
-        logger.info(f"{len(blk_grp_centers_gdf):,} record(s) in final dataset.")
-
-        # Create block groups with population totals for islands
+        # Otherwise, compute block group center points for islands using housing
+        # density while creating block groups with population totals for islands.
+        # The two datasets are built from independent files and are dominated by
+        # file reads, during which GDAL and pandas release the GIL.
         logger.info(
-            "Creating block group geometries with "
-            "population totals for U.S. Island Areas."
-        )
-        blk_grp_pops_gdf = PopulationService._build_census_block_group_populations(
-            reader,
-            island_blk_grp_pop_fpath,
-            island_blk_grp_shapefile_fpath,
-            island_blk_grp_shapefile_crs,
-            logger,
-        )
-        logger.info(f"{len(blk_grp_pops_gdf):,} record(s) in final dataset.")
-
-        # Set final CRS for island datasets
-        logger.info("Setting final CRS for island datasets.")
-        blk_grp_centers_gdf = blk_grp_centers_gdf.to_crs(output_centroids_crs)
-        blk_grp_pops_gdf = blk_grp_pops_gdf.to_crs(output_centroids_crs)
+            "Initiating processes to compute census block group centers of "
+            "population and create block groups with population totals "
+            "for the U.S. Island Areas."
+        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            centers_future = executor.submit(
+                PopulationService._build_census_block_group_centers,
+                reader,
+                island_blk_housing_fpath,
+                island_blk_shapefile_fpath,
+                island_blk_shapefile_crs,
+                logger,
+            )
+            pops_future = executor.submit(
+                PopulationService._build_census_block_group_populations,
+                reader,
+                island_blk_grp_pop_fpath,
+                island_blk_grp_shapefile_fpath,
+                island_blk_grp_shapefile_crs,
+                logger,
+            )
+            blk_grp_centers_gdf = centers_future.result()
+            blk_grp_pops_gdf = pops_future.result()
+        logger.info(f"{len(blk_grp_centers_gdf):,} block group center(s) computed.")
+        logger.info(f"{len(blk_grp_pops_gdf):,} block group population(s) loaded.")
 
         # Merge island block group centers with populations
         logger.info("Merging block group center points and population counts.")
         blk_grp_centers_gdf = blk_grp_centers_gdf.merge(
-            right=blk_grp_pops_gdf.copy()[["GEOID", "POPULATION"]],
+            right=blk_grp_pops_gdf[["GEOID", "POPULATION"]],
             how="inner",
             left_on="GEOID_BLKGRP",
             right_on="GEOID",
@@ -445,11 +478,16 @@ class PopulationService:
 
         # Drop null records
         logger.info("Dropping records with null populations.")
-        blk_grp_centers_gdf = blk_grp_centers_gdf.query("POPULATION == POPULATION")
+        has_pop = blk_grp_centers_gdf["POPULATION"].notna()
+        blk_grp_centers_gdf = blk_grp_centers_gdf[has_pop]
         logger.info(
             f"{len(blk_grp_centers_gdf):,} record(s) in final Island Area dataset."
         )
 
+        # Set final CRS for island dataset once all records have been filtered
+        logger.info("Setting final CRS for island dataset.")
+        blk_grp_centers_gdf = blk_grp_centers_gdf.to_crs(output_centroids_crs)
+
         # Finalize columns
         logger.info("Finalizing columns.")
         blk_grp_centers_gdf = blk_grp_centers_gdf[
@@ -467,8 +505,17 @@ class PopulationService:
 
         # Load population-weighted centroids for remaining U.S. areas
         logger.info("Loading population-weighted centroids for remaining U.S. areas.")
-        us_centroids_df = reader.read_csv(
-            file_name=us_blk_grp_centroids_fpath, dtype=str
+        us_centroids_df = reader.read_csv_columns(
+            file_name=us_blk_grp_centroids_fpath,
+            columns={
+                "STATEFP": pa.string(),
+                "COUNTYFP": pa.string(),
+                "TRACTCE": pa.string(),
+                "BLKGRPCE": pa.string(),
+                "POPULATION": pa.string(),
+                "LATITUDE": pa.float64(),
+                "LONGITUDE": pa.float64(),
+            },
         )
         logger.info(f"{len(us_centroids_df):,} centroid(s) found.")
 
@@ -477,7 +524,8 @@ class PopulationService:
         us_centroids_gdf = gpd.GeoDataFrame(
             data=us_centroids_df,
             geometry=gpd.points_from_xy(
-                x=us_centroids_df["LONGITUDE"], y=us_centroids_df["LATITUDE"]
+                x=us_centroids_df["LONGITUDE"].to_numpy(),
+                y=us_centroids_df["LATITUDE"].to_numpy(),
             ),
             crs=us_blk_grp_centroids_crs,
         )
@@ -493,9 +541,9 @@ class PopulationService:
 
         # Finalize columns
         logger.info("Finalizing columns.")
-        all_centroids_gdf["LATITUDE"] = all_centroids_gdf["LATITUDE"].astype(float)
-        all_centroids_gdf["LONGITUDE"] = all_centroids_gdf["LONGITUDE"].astype(float)
-        all_centroids_gdf["POPULATION"] = all_centroids_gdf["POPULATION"].astype(int)
+        all_centroids_gdf["POPULATION"] = all_centroids_gdf["POPULATION"].astype(
+            np.int32
+        )
         all_centroids_gdf = all_centroids_gdf.sort_values(
             by=["STATEFP", "COUNTYFP", "TRACTCE", "BLKGRPCE"]
         )
@@ -504,12 +552,68 @@ class PopulationService:
         logger.info("Caching to configured storage location as GeoParquet file.")
         writer.write_geoparquet(output_centroids_fpath, all_centroids_gdf)
 
+        # Record key of inputs, code and settings from which cache was built
+        if key is not None:
+            writer.write_json(manifest_fpath, key)
+
         # Create and return new instance of store
         logger.info("Instantiating new population service.")
         return PopulationService(
             all_centroids_gdf, zcta_pop_df, place_pop_df, cousub_pop_df
         )
 
+    @staticmethod
+    def _get_manifest_fpath(output_centroids_fpath: str) -> str:
+        """Returns the path to the file recording the build key
+        of the cached population-weighted centroids.
+
+        Args:
+            output_centroids_fpath (`str`): The relative path within the
+                configured data store to the cached centroids file.
+
+        Returns:
+            (`str`): The relative path to the manifest file.
+        """
+        return f"{os.path.splitext(output_centroids_fpath)[0]}.manifest.json"
+
+    @staticmethod
+    def _build_centroids_key(
+        reader: DataLoader, input_fpaths: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Builds a key identifying the inputs, code and settings from
+        which the cached population-weighted centroids are produced.
+        The key consists of the path, modification time and size of
+        every input file and a version hash of this module's source
+        and the population service settings.
+
+        Args:
+            reader (`DataLoader`): A client for reading input files
+                from a local or cloud data store.
+
+            input_fpaths (`list` of `str`): The relative paths to the
+                input files, which may contain shell-like wildcards.
+
+        Returns:
+            (`dict` | `None`): The key, or `None` if any input
+                file could not be found.
+        """
+        # Record path, modification time and size of each input file
+        inputs = []
+        for pattern in input_fpaths:
+            stats = reader.get_stats(pattern)
+            if not stats:
+                return None
+            inputs.extend([list(stat) for stat in stats])
+
+        # Hash source code used to build centroids and population service settings
+        digest = hashlib.sha256()
+        with open(__file__, "rb") as f:
+            digest.update(f.read())
+        config = json.dumps(settings.POPULATION_SERVICE, sort_keys=True, default=str)
+        digest.update(config.encode())
+
+        return {"inputs": inputs, "code_version": digest.hexdigest()}
+
     def centroids_fips_join(
         self,
         df: pd.DataFrame,
@@ -564,17 +668,17 @@ class PopulationService:
             gdf_cols = [state_col]
             pop_cols = ["STATEFP"]
 
-        # Aggregate population data
+        # Aggregate population data, keeping the 32-bit width of the centroid
+        # counts rather than the 64-bit integers produced by the sum
         agg_pops = (
-            self._pop_centroids.copy()
-            .loc[:, [*pop_cols, "POPULATION"]]
-            .groupby(pop_cols)
+            self._pop_centroids.groupby(pop_cols, sort=False)["POPULATION"]
             .sum()
+            .astype(np.int32)
             .reset_index()
         )
 
         # Merge population counts with geographies on FIPS codes
-        merged_df = df.copy().merge(
+        merged_df = df.merge(
             right=agg_pops, how="left", left_on=gdf_cols, right_on=pop_cols
         )
 
@@ -584,7 +688,49 @@ class PopulationService:
 
         return merged_df
 
-    def centroids_sjoin(self, gdf: gpd.GeoDataFrame, id_col: str) -> gpd.GeoDataFrame:
+    def _get_centroid_index(
+        self, crs: pyproj.CRS
+    ) -> Tuple[np.ndarray, shapely.STRtree]:
+        """Fetches a spatial index built over the population-weighted
+        centroids reprojected to the given CRS, along with the centroids'
+        populations as a float array aligned to the index positions. Both
+        are created on first request and then cached, because the centroids
+        are shared by every spatial join while the CRS rarely varies
+        between them. Only the geometries are reprojected, as no other
+        attributes are used by the joins.
+
+        Args:
+            crs (`pyproj.CRS`): The Coordinate Reference System.
+
+        Returns:
+            ((`np.ndarray`, `shapely.STRtree`)): The centroid
+                populations and their spatial index.
+        """
+        key = crs.to_wkt()
+        if key not in self._centroid_indices:
+            geometries = self._pop_centroids.geometry.to_crs(crs=crs)
+            tree = shapely.STRtree(geometries.values)
+            pops = self._pop_centroids["POPULATION"].to_numpy(dtype=np.float64)
+            self._centroid_indices[key] = (pops, tree)
+        return self._centroid_indices[key]
+
+    def prepare_centroids_sjoin(self, crs: Union[str, pyproj.CRS]) -> None:
+        """Reprojects and spatially indexes the population-weighted
+        centroids for the given CRS ahead of any spatial joins. Calling
+        this before forking worker processes lets every worker inherit
+        the cached index instead of each rebuilding it.
+
+        Args:
+            crs (`str` | `pyproj.CRS`): The Coordinate Reference System.
+
+        Returns:
+            `None`
+        """
+        self._get_centroid_index(pyproj.CRS.from_user_input(crs))
+
+    def centroids_sjoin(
+        self, gdf: gpd.GeoDataFrame, id_col: Optional[str] = None
+    ) -> gpd.GeoDataFrame:
         """Fetches population data for a geography dataset
         by performing a spatial join of population-weighted
         centroids (i.e., points) that fall within the geographies'
@@ -593,33 +739,42 @@ class PopulationService:
         Args:
             gdf (`gpd.GeoDataFrame`): The dataset.
 
-            id_col (`str`): The name of the column that
-                provides a unique identifier for each row.
+            id_col (`str` | `None`): The name of the column that
+                identifies each geography. Populations are summed
+                across rows sharing an identifier (e.g., the parts
+                of a geography split over multiple records). Defaults
+                to `None`, in which case each row is treated as a
+                distinct geography.
 
         Returns:
             (`gpd.GeoDataFrame`): A copy of the original GeoDataFrame with
                 the new merged population column, "population", and a column
                 indicating the aggregation method, "population_strategy".
         """
-        # Reproject population to geography's CRS
-        centroids = self._pop_centroids.copy().to_crs(crs=gdf.crs)
-
-        # Compute populations for geographies from centroids falling within borders
-        geo_pops = (
-            gdf.copy()
-            .sjoin(centroids, how="left", predicate="contains")
-            .loc[:, [id_col, "POPULATION"]]
-            .groupby(by=id_col)
-            .sum()
-            .reset_index()
+        # Fetch centroids and their spatial index in geography's CRS
+        centroid_pops, tree = self._get_centroid_index(gdf.crs)
+
+        # Query spatial index in bulk for centroids falling within borders
+        geo_idx, centroid_idx = tree.query(gdf.geometry.values, predicate="contains")
+
+        # Sum populations of matched centroids for each geography
+        geo_pops = np.bincount(
+            geo_idx, weights=centroid_pops[centroid_idx], minlength=len(gdf)
         )
 
         # Join population counts with geography dataset
-        merged_gdf = gdf.copy().merge(geo_pops, how="left", on=id_col)
+        merged_gdf = gdf.reset_index(drop=True)
+        merged_gdf["POPULATION"] = geo_pops
+
+        # Aggregate counts by identifier if geographies span multiple rows
+        if id_col and not merged_gdf[id_col].is_unique:
+            merged_gdf["POPULATION"] = merged_gdf.groupby(by=id_col, sort=False)[
+                "POPULATION"
+            ].transform("sum")
 
         # Finalize population columns
         merged_gdf = merged_gdf.rename(columns={"POPULATION": "population"})
-        merged_gdf["population"] = merged_gdf["population"].astype(int)
+        merged_gdf["population"] = merged_gdf["population"].astype(np.int32)
         merged_gdf["population_strategy"] = (
             Geography.PopulationCalculation.CENTROID_SJOIN
         )
@@ -634,8 +789,8 @@ class PopulationService:
         cousub_col: str,
     ) -> pd.DataFrame:
         """Adds population counts to U.S. census municipalities,
-        which may be places or county subdivisions, by performing
-        an attribute join on FIPS code.
+        which may be places or county subdivisions, by mapping
+        FIPS codes to population totals.
 
         Args:
             df (`pd.DataFrame`): The dataset.
@@ -650,6 +805,11 @@ class PopulationService:
             cousub_col (`str`): The name of the column holding
                 the census county subdivision FIPS code.
 
+        Raises:
+            (`RuntimeError`) if a FIPS code appears more than
+                once in the place or county subdivision
+                population table.
+
         Returns:
             (`pd.DataFrame`): A copy of the original DataFrame with
                 the new merged population column, "population", and
@@ -660,36 +820,53 @@ class PopulationService:
         places_df = df[df[dataset_col] == "places"]
         cousub_df = df[df[dataset_col] == "county subdivisions"]
 
-        # Merge population counts with place geographies on FIPS codes
-        merged_places_df = places_df.copy().merge(
-            right=self._place_pop_df[["GEOID_PLACE", "TOTAL_POPULATION"]],
-            how="left",
-            left_on=place_col,
-            right_on="GEOID_PLACE",
-        )
+        # Index population counts by FIPS code, which is unique per geography
+        place_pops = self._index_populations(self._place_pop_df, "GEOID_PLACE")
+        cousub_pops = self._index_populations(self._cousub_pop_df, "GEOID_SUBDIV")
 
-        # Merge population counts with county subdivision geographies on FIPS codes
-        merged_cousub_df = cousub_df.copy().merge(
-            right=self._cousub_pop_df[["GEOID_SUBDIV", "TOTAL_POPULATION"]],
-            how="left",
-            left_on=cousub_col,
-            right_on="GEOID_SUBDIV",
+        # Map population counts onto places and county subdivisions by FIPS code
+        merged_munis_df = pd.concat(
+            [
+                places_df.assign(population=places_df[place_col].map(place_pops)),
+                cousub_df.assign(population=cousub_df[cousub_col].map(cousub_pops)),
+            ]
         )
 
-        # Concatenate places and county subdivisions
-        merged_munis_df = pd.concat([merged_places_df, merged_cousub_df])
-
-        # Create final population columns
-        merged_munis_df = merged_munis_df.rename(
-            columns={"TOTAL_POPULATION": "population"}
-        )
+        # Add population strategy column
         merged_munis_df["population_strategy"] = Geography.PopulationCalculation.FIPS
 
         return merged_munis_df
 
+    @staticmethod
+    def _index_populations(pop_df: pd.DataFrame, code_col: str) -> pd.Series:
+        """Indexes a table's population totals by geography code
+        for lookup with `pd.Series.map`, which requires unique keys.
+
+        Args:
+            pop_df (`pd.DataFrame`): The population table.
+
+            code_col (`str`): The name of the column holding
+                the code (e.g., FIPS code) of each geography.
+
+        Raises:
+            (`RuntimeError`) if any code appears more than once.
+
+        Returns:
+            (`pd.Series`): The population totals indexed by code.
+        """
+        pops = pop_df.set_index(code_col)["TOTAL_POPULATION"]
+        if not pops.index.is_unique:
+            duplicates = pops.index[pops.index.duplicated()].unique()
+            raise RuntimeError(
+                f'Expected population table to have one row per "{code_col}", '
+                f"but found {len(duplicates):,} duplicated code(s) (e.g., "
+                f"{', '.join(map(str, duplicates[:5]))})."
+            )
+        return pops
+
     def zcta_join(self, df: pd.DataFrame, zcta_col: str) -> pd.DataFrame:
         """Adds population counts to a ZCTA dataset by
-        performing an attribute join on ZCTA code.
+        mapping ZCTA codes to population totals.
 
         Args:
             df (`pd.DataFrame`): The dataset.
@@ -697,21 +874,56 @@ class PopulationService:
             zcta_col (`str`): The name of the column
                 containing the ZCTA code for each row.
 
+        Raises:
+            (`RuntimeError`) if a ZCTA code appears more
+                than once in the ZCTA population table.
+
         Returns:
             (`pd.DataFrame`): A copy of the original DataFrame with
                 the new merged population column, "population", and a column
                 indicating the aggregation method, "population_strategy".
         """
-        # Join population counts with ZCTA dataset
-        merged_df = df.copy().merge(
-            right=self._zcta_pop_df[["ZCTA5CE20", "TOTAL_POPULATION"]],
-            how="left",
-            left_on=zcta_col,
-            right_on="ZCTA5CE20",
-        )
+        # Map population counts onto ZCTA dataset by ZCTA code, which is unique
+        zcta_pops = self._index_populations(self._zcta_pop_df, "ZCTA5CE20")
+        merged_df = df.assign(population=df[zcta_col].map(zcta_pops))
 
-        # Finalize population columns
-        merged_df = merged_df.rename(columns={"TOTAL_POPULATION": "population"})
+        # Add population strategy column
         merged_df["population_strategy"] = Geography.PopulationCalculation.FIPS
 
         return merged_df
+
+
+class PopulationServiceFactory:
+    """Factory for fetching a Singleton instance of the
+    population service initialized from configuration settings.
+    """
+
+    _service: Optional[PopulationService] = None
+
+    @staticmethod
+    def get(
+        reader: DataLoader, writer: DataWriter, logger: logging.Logger
+    ) -> PopulationService:
+        """Fetches the population service, initializing it from
+        the configured file paths on first use. Subsequent calls
+        within the same process (e.g., later stages executed by
+        the "run_pipeline" command) reuse the loaded centers of
+        population rather than reading them again.
+
+        Args:
+            reader (`DataLoader`): A client for reading input files
+                from a local or cloud data store.
+
+            writer (`DataWriter`): A client for writing data to a local
+                or cloud store.
+
+            logger (`logging.Logger`): A standard logger instance.
+
+        Returns:
+            (`PopulationService`)
+        """
+        if not PopulationServiceFactory._service:
+            PopulationServiceFactory._service = PopulationService.initialize(
+                reader, writer, *settings.POPULATION_SERVICE.values(), logger
+            )
+        return PopulationServiceFactory._service
@@ -6,8 +6,12 @@ import pytest
 from django.core.management import call_command
 
 # Application imports
+from common.db import values_insert
 from common.logger import LoggerFactory
-from tax_credit.models import TargetBonusGeographyOverlap
+from tax_credit.models import Geography, TargetBonusGeographyOverlap
+
+ASSOCIATION_COLUMNS = ["target_id", "bonus_id", "population", "population_strategy"]
+"""The association table columns populated by `values_insert`."""
 
 
 @pytest.fixture(scope="function")
@@ -95,3 +99,56 @@ def test_load_associations_with_spatial_intersection():
     # Assert
     assert spatial_only_assoc_ct > 0
     assert state_county_assoc_ct > 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_values_insert_skips_conflicting_rows():
+    """Asserts that inserting an association already present in the
+    association table skips it rather than raising an exception,
+    while still reporting every row as processed.
+    """
+    # Arrange
+    logger = LoggerFactory.get("TEST VALUES INSERT - CONFLICTS")
+    target = Geography.objects.filter(
+        geography_type=Geography.GeographyType.COUNTY
+    ).first()
+    bonus = Geography.objects.filter(
+        geography_type=Geography.GeographyType.LOW_INCOME
+    ).first()
+    rows = [(target.id, bonus.id, 100, Geography.PopulationCalculation.FIPS)]
+    initial_ct = TargetBonusGeographyOverlap.objects.count()
+    values_insert(
+        rows, TargetBonusGeographyOverlap.objects, ASSOCIATION_COLUMNS, logger
+    )
+
+    # Act
+    num_processed = values_insert(
+        rows, TargetBonusGeographyOverlap.objects, ASSOCIATION_COLUMNS, logger
+    )
+
+    # Assert
+    assert num_processed == len(rows)
+    assert TargetBonusGeographyOverlap.objects.count() == initial_ct + len(rows)
+    assert (
+        TargetBonusGeographyOverlap.objects.filter(target=target, bonus=bonus).count()
+        == 1
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_values_insert_with_empty_rows():
+    """Asserts that inserting an empty list of associations
+    processes and inserts nothing.
+    """
+    # Arrange
+    logger = LoggerFactory.get("TEST VALUES INSERT - EMPTY")
+    initial_ct = TargetBonusGeographyOverlap.objects.count()
+
+    # Act
+    num_processed = values_insert(
+        [], TargetBonusGeographyOverlap.objects, ASSOCIATION_COLUMNS, logger
+    )
+
+    # Assert
+    assert num_processed == 0
+    assert TargetBonusGeographyOverlap.objects.count() == initial_ct
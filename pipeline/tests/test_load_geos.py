@@ -2,15 +2,50 @@
 """
 
 # Third-party imports
+import geopandas as gpd
 import pytest
+import shapely
 from django.conf import settings
 from django.core.management import call_command
 
 # Application imports
+from common.db import copy_db_table, copy_insert
 from common.logger import LoggerFactory
 from tax_credit.models import Geography
 
 
+def _create_test_geographies() -> gpd.GeoDataFrame:
+    """Creates a small cleaned geography dataset with one
+    Polygon and one MultiPolygon, the former of which has
+    a population count and the latter of which has FIPS
+    codes and patterns.
+
+    Args:
+        `None`
+
+    Returns:
+        (`gpd.GeoDataFrame`): The dataset.
+    """
+    return gpd.GeoDataFrame(
+        {
+            "name": ["Polygon Geography", "MultiPolygon Geography"],
+            "fips": [None, "01"],
+            "fips_pattern": [None, Geography.FipsPattern.STATE],
+            "geography_type": [Geography.GeographyType.STATE] * 2,
+            "population": [100.0, None],
+            "population_strategy": [Geography.PopulationCalculation.FIPS] * 2,
+            "as_of": ["2020-01-01"] * 2,
+            "published_on": [None, "2021-02-02"],
+            "source": ["Test Source"] * 2,
+        },
+        geometry=[
+            shapely.box(0, 0, 1, 1),
+            shapely.MultiPolygon([shapely.box(2, 2, 3, 3), shapely.box(4, 4, 5, 5)]),
+        ],
+        crs="EPSG:4326",
+    )
+
+
 @pytest.mark.django_db(transaction=True)
 def test_load_geos():
     """Asserts that the `load_geos` Django management command
@@ -34,3 +69,87 @@ def test_load_geos():
 
     # Assert
     assert 0 < geography_ct <= (records_per_dataset * num_datasets)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_copy_insert_geography_rows():
+    """Asserts that a cleaned geography dataset mapped to table
+    rows can be bulk inserted with `COPY` and read back with its
+    values intact and its geometries stored as MultiPolygons.
+    """
+    # Arrange
+    logger = LoggerFactory.get("TEST COPY INSERT GEOGRAPHY ROWS")
+    data = _create_test_geographies()
+
+    # Act
+    rows = Geography.to_table_rows(data)
+    num_processed = copy_insert(rows, Geography.objects, logger)
+    polygon_geo = Geography.objects.get(name="Polygon Geography")
+    multipolygon_geo = Geography.objects.get(name="MultiPolygon Geography")
+
+    # Assert
+    assert num_processed == Geography.objects.count() == 2
+    assert polygon_geo.fips == polygon_geo.fips_pattern == ""
+    assert polygon_geo.population == 100
+    assert polygon_geo.published_on is None
+    assert multipolygon_geo.fips == "01"
+    assert multipolygon_geo.fips_pattern == Geography.FipsPattern.STATE
+    assert multipolygon_geo.population is None
+    for geo, geom in zip((polygon_geo, multipolygon_geo), data.geometry):
+        assert geo.geometry.geom_type == "MultiPolygon"
+        assert geo.geometry.srid == 4326
+        assert shapely.equals(shapely.from_wkb(bytes(geo.geometry.wkb)), geom)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_copy_insert_skips_conflicting_rows():
+    """Asserts that copying rows already present in the geography
+    table skips them rather than raising an exception, while still
+    reporting every row as processed.
+    """
+    # Arrange
+    logger = LoggerFactory.get("TEST COPY INSERT - CONFLICTS")
+    rows = Geography.to_table_rows(_create_test_geographies())
+    copy_insert(rows, Geography.objects, logger)
+
+    # Act
+    num_processed = copy_insert(rows, Geography.objects, logger)
+
+    # Assert
+    assert num_processed == len(rows)
+    assert Geography.objects.count() == len(rows)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_copy_insert_with_empty_data():
+    """Asserts that copying an empty set of rows into the
+    geography table processes and inserts nothing.
+    """
+    # Arrange
+    logger = LoggerFactory.get("TEST COPY INSERT - EMPTY")
+    rows = Geography.to_table_rows(_create_test_geographies().iloc[:0])
+
+    # Act
+    num_processed = copy_insert(rows, Geography.objects, logger)
+
+    # Assert
+    assert num_processed == 0
+    assert Geography.objects.count() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_copy_db_table_skips_conflicting_rows():
+    """Asserts that copying the geography table into a database
+    table that already holds its rows skips every conflicting row
+    rather than raising an exception or duplicating records.
+    """
+    # Arrange
+    logger = LoggerFactory.get("TEST COPY DB TABLE - CONFLICTS")
+    rows = Geography.to_table_rows(_create_test_geographies())
+    copy_insert(rows, Geography.objects, logger)
+
+    # Act
+    copy_db_table(Geography.objects, "default", "default", ignore_conflicts=True)
+
+    # Assert
+    assert Geography.objects.count() == len(rows)
@@ -0,0 +1,107 @@
+"""Tests for loading Parquet files row-wise, in batches, and in full.
+"""
+
+# Standard library imports
+import shutil
+import tempfile
+import unittest
+
+# Third-party imports
+import geopandas as gpd
+import pandas as pd
+
+# Application imports
+from common.storage import DataLoader, FileSystemHelperFactory, ParquetDataReader
+
+
+class TestLoadParquet(unittest.TestCase):
+    """Tests reading Parquet files with and without geometries
+    using `ParquetDataReader` and `DataLoader` instances.
+    """
+
+    _GEOPARQUET_FILE_NAME = "test.geoparquet"
+    _TABULAR_FILE_NAME = "test.tabular.parquet"
+    _TEST_FILE_NUM_COLS = 10
+    _TEST_FILE_NUM_ROWS = 5
+    _TEST_BATCH_SIZE = 2
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Sets up the class before tests run."""
+        # Create temporary root directory
+        cls._ROOT_DIR = tempfile.mkdtemp()
+
+        # Arrange data
+        data = [
+            {str(i): i for i in range(cls._TEST_FILE_NUM_COLS)}
+            for _ in range(cls._TEST_FILE_NUM_ROWS)
+        ]
+        df = pd.DataFrame(data)
+        gdf = gpd.GeoDataFrame(
+            df, geometry=gpd.points_from_xy(x=df["0"], y=df["1"]), crs="EPSG:4326"
+        )
+
+        # Write Parquet files with and without geometries
+        helper = FileSystemHelperFactory.get()
+        with helper.open_file(cls._TABULAR_FILE_NAME, cls._ROOT_DIR, mode="wb") as f:
+            df.to_parquet(f, index=False)
+        with helper.open_file(cls._GEOPARQUET_FILE_NAME, cls._ROOT_DIR, mode="wb") as f:
+            gdf.to_parquet(f, index=False)
+
+        # Initialize data reader clients
+        cls._READER = ParquetDataReader(cls._ROOT_DIR)
+        cls._LOADER = DataLoader(cls._ROOT_DIR)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Destroys resources after all tests run."""
+        shutil.rmtree(cls._ROOT_DIR)
+
+    def test_iterate_columns(self) -> None:
+        """Asserts that iteration can be restricted to a subset of columns."""
+        rows = [
+            row
+            for row in self._READER.iterate(self._TABULAR_FILE_NAME, columns=["0", "1"])
+        ]
+        assert len(rows) == self._TEST_FILE_NUM_ROWS
+        assert all(list(row.keys()) == ["0", "1"] for row in rows)
+
+    def test_iterate_frames(self) -> None:
+        """Asserts that a Parquet file without geometries can be
+        iterated one DataFrame of at most the batch size at a time.
+        """
+        frames = [
+            df
+            for df in self._READER.iterate_frames(
+                self._TABULAR_FILE_NAME, batch_size=self._TEST_BATCH_SIZE
+            )
+        ]
+        assert len(frames) > 1
+        assert sum(len(df) for df in frames) == self._TEST_FILE_NUM_ROWS
+        assert all(len(df) <= self._TEST_BATCH_SIZE for df in frames)
+        assert all(len(df.columns) == self._TEST_FILE_NUM_COLS for df in frames)
+        assert not any(isinstance(df, gpd.GeoDataFrame) for df in frames)
+
+    def test_iterate_geoparquet_frames(self) -> None:
+        """Asserts that a GeoParquet file is iterated one
+        GeoDataFrame at a time with its geometries decoded
+        and its coordinate reference system preserved.
+        """
+        frames = [
+            gdf
+            for gdf in self._READER.iterate_frames(
+                self._GEOPARQUET_FILE_NAME, batch_size=self._TEST_BATCH_SIZE
+            )
+        ]
+        assert sum(len(gdf) for gdf in frames) == self._TEST_FILE_NUM_ROWS
+        assert all(isinstance(gdf, gpd.GeoDataFrame) for gdf in frames)
+        assert all(gdf.crs.to_epsg() == 4326 for gdf in frames)
+        assert all((gdf.geometry.geom_type == "Point").all() for gdf in frames)
+
+    def test_read_tabular_parquet(self) -> None:
+        """Asserts that a Parquet file without geometries
+        is read into a plain Pandas DataFrame.
+        """
+        df = self._LOADER.read_parquet(self._TABULAR_FILE_NAME)
+        assert len(df) == self._TEST_FILE_NUM_ROWS
+        assert not isinstance(df, gpd.GeoDataFrame)